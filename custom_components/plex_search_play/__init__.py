@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import partial
 import logging
 from pathlib import Path
+import time
 from typing import Any
 
 import voluptuous as vol
@@ -16,13 +20,17 @@ from homeassistant.components.media_player import (
     MediaType,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
+    ATTR_CONFIG_ENTRY_ID,
     ATTR_RATING_KEY,
+    CACHE_TTL_SECONDS,
     CONF_LIBRARIES,
     CONF_PLEX_TOKEN,
     CONF_PLEX_URL,
@@ -35,6 +43,7 @@ from .const import (
     EVENT_SEARCH_COMPLETED,
     EVENT_SEARCH_FAILED,
     EVENT_SEARCH_STARTED,
+    MEDIA_TYPE_TRACK,
     SERVICE_BROWSE_LIBRARY,
     SERVICE_CLEAR_RESULTS,
     SERVICE_GET_BY_GENRE,
@@ -43,18 +52,25 @@ from .const import (
     SERVICE_GET_RECENTLY_ADDED,
     SERVICE_PLAY_MEDIA as PLEX_SERVICE_PLAY_MEDIA,
     SERVICE_SEARCH,
+    VIDEO_MEDIA_TYPES,
 )
-from .plex_api import PlexSearchAPI, PlexSearchAPIError
+from .plex_api import PlexSearchAPI, PlexSearchAPIError, shutdown_executor
 
 _LOGGER = logging.getLogger(__name__)
 
+PLEX_PLATFORM = "plex"
+
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 # Service schemas
 SERVICE_SEARCH_SCHEMA = vol.Schema(
     {
-        vol.Required("query"): cv.string,
+        # A blank query would run an unfiltered search of every library
+        vol.Required("query"): vol.All(cv.string, vol.Strip, vol.Length(min=1)),
         vol.Optional("limit", default=6): cv.positive_int,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
@@ -62,6 +78,13 @@ SERVICE_PLAY_MEDIA_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_RATING_KEY): cv.string,
         vol.Required("player_entity_id"): cv.entity_id,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
+SERVICE_CLEAR_RESULTS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
@@ -71,18 +94,21 @@ SERVICE_BROWSE_LIBRARY_SCHEMA = vol.Schema(
         vol.Optional("start", default=0): cv.positive_int,
         vol.Optional("limit", default=DEFAULT_BROWSE_PAGE_SIZE): cv.positive_int,
         vol.Optional("sort"): cv.string,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
 SERVICE_GET_ON_DECK_SCHEMA = vol.Schema(
     {
         vol.Optional("limit", default=20): cv.positive_int,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
 SERVICE_GET_RECENTLY_ADDED_SCHEMA = vol.Schema(
     {
         vol.Optional("limit", default=DEFAULT_BROWSE_LIMIT): cv.positive_int,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
@@ -91,424 +117,706 @@ SERVICE_GET_BY_GENRE_SCHEMA = vol.Schema(
         vol.Required("library_name"): cv.string,
         vol.Required("genre"): cv.string,
         vol.Optional("limit", default=DEFAULT_BROWSE_LIMIT): cv.positive_int,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
 SERVICE_GET_COLLECTIONS_SCHEMA = vol.Schema(
     {
         vol.Required("library_name"): cv.string,
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
     }
 )
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Plex Search and Play from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
+async def _async_cached_call(
+    entry_data: dict[str, Any],
+    func: Callable[..., Awaitable[Any]],
+    *,
+    key_overrides: dict[str, Any] | None = None,
+    **kwargs: Any,
+) -> Any:
+    """Call a Plex API coroutine, reusing recent results for identical arguments.
+
+    Results are cached for CACHE_TTL_SECONDS. Concurrent calls with the same
+    arguments share a single in-flight task so only one request reaches the
+    server; the others await its result.
+
+    key_overrides replaces argument values in the cache key only, so callers
+    can normalize a value for caching while passing the original to func.
+    """
+    key_kwargs = {**kwargs, **key_overrides} if key_overrides else kwargs
+    key = (
+        func.__name__,
+        frozenset(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in key_kwargs.items()
+        ),
+    )
+    cache: dict[tuple, tuple[float, Any]] = entry_data["cache"]
+    inflight: dict[tuple, asyncio.Task] = entry_data["inflight"]
+
+    cached = cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < CACHE_TTL_SECONDS:
+        _LOGGER.debug("Serving %s from cache", func.__name__)
+        return cached[1]
+
+    if (task := inflight.get(key)) is None:
+        task = asyncio.create_task(func(**kwargs), name=f"{DOMAIN}_{func.__name__}")
+        inflight[key] = task
+        task.add_done_callback(partial(_async_store_cached_result, cache, inflight, key))
+    else:
+        _LOGGER.debug("Joining in-flight %s request", func.__name__)
+
+    # Shield so a cancelled caller doesn't cancel the request for everyone else
+    return await asyncio.shield(task)
+
+
+@callback
+def _async_store_cached_result(
+    cache: dict[tuple, tuple[float, Any]],
+    inflight: dict[tuple, asyncio.Task],
+    key: tuple,
+    task: asyncio.Task,
+) -> None:
+    """Move a finished in-flight request into the response cache."""
+    inflight.pop(key, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+
+    # Drop expired entries so the cache doesn't grow with every unique query
+    now = time.monotonic()
+    for stale_key in [k for k, (ts, _) in cache.items() if now - ts >= CACHE_TTL_SECONDS]:
+        del cache[stale_key]
+    cache[key] = (now, task.result())
+
+
+@callback
+def _async_resolve_config(entry: ConfigEntry) -> dict[str, Any]:
+    """Resolve player and library selection, preferring options over data.
+
+    Players are stored as a frozenset for constant-time membership checks and
+    libraries as a tuple so they can be used directly in cache keys.
+    """
+    return {
+        "selected_players": frozenset(
+            entry.options.get(
+                CONF_SELECTED_PLAYERS,
+                entry.data.get(CONF_SELECTED_PLAYERS, ())
+            )
+        ),
+        "libraries": tuple(
+            entry.options.get(
+                CONF_LIBRARIES,
+                entry.data.get(CONF_LIBRARIES, ())
+            )
+        ),
+    }
 
-    # Get configuration - prefer options over data for player/library selection
-    plex_url = entry.data[CONF_PLEX_URL]
-    plex_token = entry.data[CONF_PLEX_TOKEN]
-    selected_players = entry.options.get(
-        CONF_SELECTED_PLAYERS,
-        entry.data.get(CONF_SELECTED_PLAYERS, [])
+
+@callback
+def _async_get_entry_data(hass: HomeAssistant, call: ServiceCall) -> dict[str, Any]:
+    """Return the stored data of the config entry a service call is routed to.
+
+    An explicit config_entry_id wins. Otherwise play_media calls go to the entry
+    whose player list contains the target, and everything else goes to the
+    first loaded entry.
+    """
+    entries: dict[str, dict[str, Any]] = hass.data.get(DOMAIN, {})
+
+    if (entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID)) is not None:
+        if entry_id not in entries:
+            raise HomeAssistantError(f"Config entry {entry_id} is not loaded")
+        return entries[entry_id]
+
+    if not entries:
+        raise HomeAssistantError("No Plex Search and Play servers are configured")
+
+    if (player_entity_id := call.data.get("player_entity_id")) is not None:
+        for entry_data in entries.values():
+            if player_entity_id in entry_data["selected_players"]:
+                return entry_data
+
+    return next(iter(entries.values()))
+
+
+@callback
+def _async_fire_search_completed(
+    hass: HomeAssistant,
+    entry_data: dict[str, Any],
+    results: list[dict[str, Any]],
+    **event_data: Any,
+) -> None:
+    """Update the entry's sensors and schedule the search completed event.
+
+    The event data is built from the keyword arguments plus the result count.
+
+    Sensors are updated inline so they already show the results when the
+    service call returns. Event listeners run inline when an event is fired,
+    so the event is fired from a background task and the service call
+    doesn't wait on them. The task is tied to the config entry and is
+    cancelled if the entry unloads first.
+    """
+    event_data["result_count"] = len(results)
+
+    coordinator: DataUpdateCoordinator[dict[str, Any]] = entry_data["coordinator"]
+    coordinator.async_set_updated_data(
+        {"results": results, "query": event_data.get("query", "")}
     )
-    libraries = entry.options.get(
-        CONF_LIBRARIES,
-        entry.data.get(CONF_LIBRARIES, [])
+
+    entry: ConfigEntry = entry_data["entry"]
+    entry.async_create_background_task(
+        hass,
+        _async_emit_search_completed(hass, event_data, results),
+        f"{DOMAIN}_emit_search_completed",
     )
 
-    # Create API instance
-    api = PlexSearchAPI(plex_url, plex_token)
 
-    try:
-        await api.async_connect()
-    except PlexSearchAPIError as err:
-        _LOGGER.error("Failed to connect to Plex server: %s", err)
-        return False
+async def _async_emit_search_completed(
+    hass: HomeAssistant, event_data: dict[str, Any], results: list[dict[str, Any]]
+) -> None:
+    """Fire the search completed event with the full results attached."""
+    # Yield once so the event is never fired inline, even if the task is
+    # started eagerly
+    await asyncio.sleep(0)
 
-    # Store API instance and config
-    hass.data[DOMAIN][entry.entry_id] = {
-        "api": api,
-        "selected_players": selected_players,
-        "libraries": libraries,
-        "search_results": [],
+    event_data["results"] = results
+    hass.bus.async_fire(EVENT_SEARCH_COMPLETED, event_data)
+
+
+@callback
+def _async_get_plex_players(hass: HomeAssistant) -> set[str]:
+    """Return the entity IDs of media players provided by the Plex integration."""
+    return {
+        entity.entity_id
+        for entity in er.async_get(hass).entities.values()
+        if entity.platform == PLEX_PLATFORM and entity.domain == MEDIA_PLAYER_DOMAIN
     }
 
-    # Set up platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Register update listener to update config when options change
-    entry.async_on_unload(entry.add_update_listener(update_listener))
+async def _async_handle_search(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Handle the search service call."""
+    entry_data = _async_get_entry_data(hass, call)
+    api = entry_data["api"]
+    query = call.data["query"]
+    limit = call.data.get("limit", 6)
 
-    # Register services
-    async def handle_search(call: ServiceCall) -> None:
-        """Handle the search service call."""
-        query = call.data["query"]
-        limit = call.data.get("limit", 6)
+    _LOGGER.info("Searching Plex for: %s (limit: %d)", query, limit)
+
+    # Fire search started event
+    hass.bus.async_fire(
+        EVENT_SEARCH_STARTED,
+        {"query": query, "limit": limit}
+    )
+
+    try:
+        # Get current libraries from hass.data (updated by config changes)
+        current_libraries = entry_data["libraries"]
+
+        # Perform search; Plex matches case-insensitively, so the cache key
+        # uses the lowercased query and differently-cased repeats share a
+        # cached response. Plex itself gets the query as given.
+        results = await _async_cached_call(
+            entry_data,
+            api.async_search,
+            key_overrides={"query": query.lower()},
+            query=query,
+            library_sections=current_libraries or None,
+            limit=limit
+        )
 
-        _LOGGER.info("Searching Plex for: %s (limit: %d)", query, limit)
+        # Store results
+        entry_data["search_results"] = results
 
-        # Fire search started event
+        # Fire search completed event
+        _async_fire_search_completed(
+            hass,
+            entry_data,
+            results,
+            query=query,
+        )
+
+        _LOGGER.info("Search completed: %d results found", len(results))
+
+    except PlexSearchAPIError as err:
+        _LOGGER.error("Search failed: %s", err)
         hass.bus.async_fire(
-            EVENT_SEARCH_STARTED,
-            {"query": query, "limit": limit}
+            EVENT_SEARCH_FAILED,
+            {"query": query, "error": str(err)}
         )
+        raise HomeAssistantError(f"Search failed: {err}") from err
 
-        try:
-            # Get current libraries from hass.data (updated by config changes)
-            current_libraries = hass.data[DOMAIN][entry.entry_id].get("libraries", [])
 
-            # Perform search
-            results = await api.async_search(
-                query=query,
-                library_sections=current_libraries if current_libraries else None,
-                limit=limit
-            )
+async def _async_handle_play_media(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Handle the play_media service call."""
+    entry_data = _async_get_entry_data(hass, call)
+    api = entry_data["api"]
+    rating_key = call.data[ATTR_RATING_KEY]
+    player_entity_id = call.data["player_entity_id"]
 
-            # Store results
-            hass.data[DOMAIN][entry.entry_id]["search_results"] = results
-
-            # Fire search completed event
-            hass.bus.async_fire(
-                EVENT_SEARCH_COMPLETED,
-                {
-                    "query": query,
-                    "result_count": len(results),
-                    "results": results
-                }
-            )
+    _LOGGER.info("Playing media (rating_key: %s) on %s", rating_key, player_entity_id)
 
-            _LOGGER.info("Search completed: %d results found", len(results))
+    # Get current selected players from hass.data (updated by config changes)
+    current_selected_players = entry_data["selected_players"]
 
-        except PlexSearchAPIError as err:
-            _LOGGER.error("Search failed: %s", err)
-            hass.bus.async_fire(
-                EVENT_SEARCH_FAILED,
-                {"query": query, "error": str(err)}
+    # Validate player is in selected list
+    if current_selected_players and player_entity_id not in current_selected_players:
+        error_msg = f"Player {player_entity_id} is not in the selected players list"
+        _LOGGER.error(error_msg)
+        hass.bus.async_fire(
+            EVENT_PLAYBACK_FAILED,
+            {
+                "rating_key": rating_key,
+                "player": player_entity_id,
+                "error": error_msg
+            }
+        )
+        raise HomeAssistantError(error_msg)
+
+    try:
+        # Check if this is a Plex media player (from the Plex integration)
+        is_plex_player = player_entity_id in entry_data["plex_players"]
+
+        if is_plex_player:
+            # Plex media players: Use JSON payload format
+            # The Plex integration expects a JSON string with the plex_key
+            import json
+            payload = {
+                "plex_key": f"/library/metadata/{rating_key}"
+            }
+            media_url = json.dumps(payload)
+            content_type = "music"  # Special type that triggers Plex integration processing
+            _LOGGER.debug(
+                "Using Plex media player with payload: %s",
+                payload,
             )
-            raise HomeAssistantError(f"Search failed: {err}") from err
-
-    async def handle_play_media(call: ServiceCall) -> None:
-        """Handle the play_media service call."""
-        rating_key = call.data[ATTR_RATING_KEY]
-        player_entity_id = call.data["player_entity_id"]
-
-        _LOGGER.info("Playing media (rating_key: %s) on %s", rating_key, player_entity_id)
-
-        # Get current selected players from hass.data (updated by config changes)
-        current_selected_players = hass.data[DOMAIN][entry.entry_id].get("selected_players", [])
-
-        # Validate player is in selected list
-        if current_selected_players and player_entity_id not in current_selected_players:
-            error_msg = f"Player {player_entity_id} is not in the selected players list"
-            _LOGGER.error(error_msg)
-            hass.bus.async_fire(
-                EVENT_PLAYBACK_FAILED,
-                {
-                    "rating_key": rating_key,
-                    "player": player_entity_id,
-                    "error": error_msg
-                }
+        else:
+            # Other players: Use direct media URL
+            media_url, media_type = await api.async_get_media_url(rating_key)
+            safe_url = media_url.replace(api._plex_token, "***")
+            _LOGGER.debug(
+                "Resolved media URL for rating_key=%s: %s (type: %s)",
+                rating_key,
+                safe_url,
+                media_type,
             )
-            raise HomeAssistantError(error_msg)
-
-        try:
-            # Check if this is a Plex media player (from the Plex integration)
-            is_plex_player = "plex" in player_entity_id.lower() and "plex_search_play" not in player_entity_id.lower()
-
-            if is_plex_player:
-                # Plex media players: Use JSON payload format
-                # The Plex integration expects a JSON string with the plex_key
-                import json
-                payload = {
-                    "plex_key": f"/library/metadata/{rating_key}"
-                }
-                media_url = json.dumps(payload)
-                content_type = "music"  # Special type that triggers Plex integration processing
-                _LOGGER.debug(
-                    "Using Plex media player with payload: %s",
-                    payload,
-                )
+
+            # Determine the correct media content type
+            if media_type == MEDIA_TYPE_TRACK:
+                content_type = MediaType.MUSIC
+            elif media_type in VIDEO_MEDIA_TYPES:
+                content_type = MediaType.VIDEO
             else:
-                # Other players: Use direct media URL
-                media_url, media_type = await api.async_get_media_url(rating_key)
-                safe_url = media_url.replace(api._plex_token, "***")
-                _LOGGER.debug(
-                    "Resolved media URL for rating_key=%s: %s (type: %s)",
-                    rating_key,
-                    safe_url,
-                    media_type,
-                )
-
-                # Determine the correct media content type
-                if media_type == "track":
-                    content_type = MediaType.MUSIC
-                elif media_type in ("movie", "episode", "video"):
-                    content_type = MediaType.VIDEO
-                else:
-                    content_type = MediaType.URL
-
-            await hass.services.async_call(
-                MEDIA_PLAYER_DOMAIN,
-                SERVICE_PLAY_MEDIA,
-                {
-                    "entity_id": player_entity_id,
-                    ATTR_MEDIA_CONTENT_TYPE: content_type,
-                    ATTR_MEDIA_CONTENT_ID: media_url,
-                },
-                blocking=True,
-            )
+                content_type = MediaType.URL
+
+        await hass.services.async_call(
+            MEDIA_PLAYER_DOMAIN,
+            SERVICE_PLAY_MEDIA,
+            {
+                "entity_id": player_entity_id,
+                ATTR_MEDIA_CONTENT_TYPE: content_type,
+                ATTR_MEDIA_CONTENT_ID: media_url,
+            },
+            blocking=True,
+        )
 
-            # Fire playback started event
-            hass.bus.async_fire(
-                EVENT_PLAYBACK_STARTED,
-                {
-                    "rating_key": rating_key,
-                    "player": player_entity_id,
-                    "media_url": media_url
-                }
-            )
+        # Fire playback started event
+        hass.bus.async_fire(
+            EVENT_PLAYBACK_STARTED,
+            {
+                "rating_key": rating_key,
+                "player": player_entity_id,
+                "media_url": media_url
+            }
+        )
 
-            _LOGGER.info("Playback started successfully")
-
-        except PlexSearchAPIError as err:
-            _LOGGER.error("Failed to get media URL: %s", err)
-            hass.bus.async_fire(
-                EVENT_PLAYBACK_FAILED,
-                {
-                    "rating_key": rating_key,
-                    "player": player_entity_id,
-                    "error": str(err)
-                }
-            )
-            raise HomeAssistantError(f"Failed to play media: {err}") from err
-
-    async def handle_clear_results(call: ServiceCall) -> None:
-        """Handle the clear_results service call."""
-        hass.data[DOMAIN][entry.entry_id]["search_results"] = []
-        _LOGGER.info("Search results cleared")
-
-    async def handle_browse_library(call: ServiceCall) -> None:
-        """Handle the browse_library service call."""
-        library_name = call.data["library_name"]
-        start = call.data.get("start", 0)
-        limit = call.data.get("limit", DEFAULT_BROWSE_PAGE_SIZE)
-        sort = call.data.get("sort")
-
-        _LOGGER.info("Browsing library: %s (start=%d, limit=%d)", library_name, start, limit)
-
-        try:
-            result = await api.async_browse_library(
-                library_name=library_name,
-                start=start,
-                limit=limit,
-                sort=sort
-            )
+        _LOGGER.info("Playback started successfully")
 
-            # Store results
-            hass.data[DOMAIN][entry.entry_id]["search_results"] = result["results"]
-
-            # Fire event with browse results
-            hass.bus.async_fire(
-                EVENT_SEARCH_COMPLETED,
-                {
-                    "library": library_name,
-                    "result_count": len(result["results"]),
-                    "total_count": result["total_count"],
-                    "has_more": result["has_more"],
-                    "results": result["results"]
-                }
-            )
+    except PlexSearchAPIError as err:
+        _LOGGER.error("Failed to get media URL: %s", err)
+        hass.bus.async_fire(
+            EVENT_PLAYBACK_FAILED,
+            {
+                "rating_key": rating_key,
+                "player": player_entity_id,
+                "error": str(err)
+            }
+        )
+        raise HomeAssistantError(f"Failed to play media: {err}") from err
 
-            _LOGGER.info("Browse completed: %d results found", len(result["results"]))
 
-        except PlexSearchAPIError as err:
-            _LOGGER.error("Browse failed: %s", err)
-            raise HomeAssistantError(f"Browse failed: {err}") from err
+async def _async_handle_clear_results(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Handle the clear_results service call."""
+    entry_data = _async_get_entry_data(hass, call)
+    entry_data["search_results"] = []
+    entry_data["cache"].clear()
+    entry_data["coordinator"].async_set_updated_data({"results": [], "query": ""})
+    _LOGGER.info("Search results cleared")
 
-    async def handle_get_on_deck(call: ServiceCall) -> None:
-        """Handle the get_on_deck service call."""
-        limit = call.data.get("limit", 20)
 
-        _LOGGER.info("Getting on deck items (limit=%d)", limit)
+async def _async_handle_browse_library(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Handle the browse_library service call."""
+    entry_data = _async_get_entry_data(hass, call)
+    api = entry_data["api"]
+    library_name = call.data["library_name"]
+    start = call.data.get("start", 0)
+    limit = call.data.get("limit", DEFAULT_BROWSE_PAGE_SIZE)
+    sort = call.data.get("sort")
 
-        try:
-            results = await api.async_get_on_deck(
-                library_sections=libraries if libraries else None,
-                limit=limit
-            )
+    _LOGGER.info("Browsing library: %s (start=%d, limit=%d)", library_name, start, limit)
 
-            # Store results
-            hass.data[DOMAIN][entry.entry_id]["search_results"] = results
-
-            # Fire event
-            hass.bus.async_fire(
-                EVENT_SEARCH_COMPLETED,
-                {
-                    "type": "on_deck",
-                    "result_count": len(results),
-                    "results": results
-                }
-            )
+    try:
+        result = await _async_cached_call(
+            entry_data,
+            api.async_browse_library,
+            library_name=library_name,
+            start=start,
+            limit=limit,
+            sort=sort
+        )
 
-            _LOGGER.info("On deck completed: %d results found", len(results))
+        # Store results
+        entry_data["search_results"] = result["results"]
+
+        # Fire event with browse results
+        _async_fire_search_completed(
+            hass,
+            entry_data,
+            result["results"],
+            library=library_name,
+            total_count=result["total_count"],
+            has_more=result["has_more"],
+        )
 
-        except PlexSearchAPIError as err:
-            _LOGGER.error("Get on deck failed: %s", err)
-            raise HomeAssistantError(f"Get on deck failed: {err}") from err
+        _LOGGER.info("Browse completed: %d results found", len(result["results"]))
 
-    async def handle_get_recently_added(call: ServiceCall) -> None:
-        """Handle the get_recently_added service call."""
-        limit = call.data.get("limit", DEFAULT_BROWSE_LIMIT)
+    except PlexSearchAPIError as err:
+        _LOGGER.error("Browse failed: %s", err)
+        raise HomeAssistantError(f"Browse failed: {err}") from err
 
-        _LOGGER.info("Getting recently added items (limit=%d)", limit)
 
-        try:
-            results = await api.async_get_recently_added(
-                library_sections=libraries if libraries else None,
-                limit=limit
-            )
+async def _async_handle_get_on_deck(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Handle the get_on_deck service call."""
+    entry_data = _async_get_entry_data(hass, call)
+    api = entry_data["api"]
+    limit = call.data.get("limit", 20)
 
-            # Store results
-            hass.data[DOMAIN][entry.entry_id]["search_results"] = results
-
-            # Fire event
-            hass.bus.async_fire(
-                EVENT_SEARCH_COMPLETED,
-                {
-                    "type": "recently_added",
-                    "result_count": len(results),
-                    "results": results
-                }
-            )
+    _LOGGER.info("Getting on deck items (limit=%d)", limit)
 
-            _LOGGER.info("Recently added completed: %d results found", len(results))
+    # Get current libraries from hass.data (updated by config changes)
+    libraries = entry_data["libraries"]
 
-        except PlexSearchAPIError as err:
-            _LOGGER.error("Get recently added failed: %s", err)
-            raise HomeAssistantError(f"Get recently added failed: {err}") from err
+    try:
+        results = await _async_cached_call(
+            entry_data,
+            api.async_get_on_deck,
+            library_sections=libraries or None,
+            limit=limit
+        )
 
-    async def handle_get_by_genre(call: ServiceCall) -> None:
-        """Handle the get_by_genre service call."""
-        library_name = call.data["library_name"]
-        genre = call.data["genre"]
-        limit = call.data.get("limit", DEFAULT_BROWSE_LIMIT)
+        # Store results
+        entry_data["search_results"] = results
 
-        _LOGGER.info("Getting items by genre: %s from %s (limit=%d)", genre, library_name, limit)
+        # Fire event
+        _async_fire_search_completed(
+            hass,
+            entry_data,
+            results,
+            type="on_deck",
+        )
 
-        try:
-            results = await api.async_get_by_genre(
-                library_name=library_name,
-                genre=genre,
-                limit=limit
-            )
+        _LOGGER.info("On deck completed: %d results found", len(results))
 
-            # Store results
-            hass.data[DOMAIN][entry.entry_id]["search_results"] = results
-
-            # Fire event
-            hass.bus.async_fire(
-                EVENT_SEARCH_COMPLETED,
-                {
-                    "type": "genre",
-                    "genre": genre,
-                    "library": library_name,
-                    "result_count": len(results),
-                    "results": results
-                }
-            )
+    except PlexSearchAPIError as err:
+        _LOGGER.error("Get on deck failed: %s", err)
+        raise HomeAssistantError(f"Get on deck failed: {err}") from err
 
-            _LOGGER.info("Genre browse completed: %d results found", len(results))
 
-        except PlexSearchAPIError as err:
-            _LOGGER.error("Get by genre failed: %s", err)
-            raise HomeAssistantError(f"Get by genre failed: {err}") from err
+async def _async_handle_get_recently_added(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Handle the get_recently_added service call."""
+    entry_data = _async_get_entry_data(hass, call)
+    api = entry_data["api"]
+    limit = call.data.get("limit", DEFAULT_BROWSE_LIMIT)
 
-    async def handle_get_collections(call: ServiceCall) -> None:
-        """Handle the get_collections service call."""
-        library_name = call.data["library_name"]
+    _LOGGER.info("Getting recently added items (limit=%d)", limit)
 
-        _LOGGER.info("Getting collections from: %s", library_name)
+    # Get current libraries from hass.data (updated by config changes)
+    libraries = entry_data["libraries"]
 
-        try:
-            results = await api.async_get_collections(library_name=library_name)
+    try:
+        results = await _async_cached_call(
+            entry_data,
+            api.async_get_recently_added,
+            library_sections=libraries or None,
+            limit=limit
+        )
 
-            # Store results
-            hass.data[DOMAIN][entry.entry_id]["search_results"] = results
+        # Store results
+        entry_data["search_results"] = results
 
-            # Fire event
-            hass.bus.async_fire(
-                EVENT_SEARCH_COMPLETED,
-                {
-                    "type": "collections",
-                    "library": library_name,
-                    "result_count": len(results),
-                    "results": results
-                }
-            )
+        # Fire event
+        _async_fire_search_completed(
+            hass,
+            entry_data,
+            results,
+            type="recently_added",
+        )
+
+        _LOGGER.info("Recently added completed: %d results found", len(results))
+
+    except PlexSearchAPIError as err:
+        _LOGGER.error("Get recently added failed: %s", err)
+        raise HomeAssistantError(f"Get recently added failed: {err}") from err
+
+
+async def _async_handle_get_by_genre(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Handle the get_by_genre service call."""
+    entry_data = _async_get_entry_data(hass, call)
+    api = entry_data["api"]
+    library_name = call.data["library_name"]
+    genre = call.data["genre"]
+    limit = call.data.get("limit", DEFAULT_BROWSE_LIMIT)
+
+    _LOGGER.info("Getting items by genre: %s from %s (limit=%d)", genre, library_name, limit)
+
+    try:
+        results = await _async_cached_call(
+            entry_data,
+            api.async_get_by_genre,
+            library_name=library_name,
+            genre=genre,
+            limit=limit
+        )
+
+        # Store results
+        entry_data["search_results"] = results
+
+        # Fire event
+        _async_fire_search_completed(
+            hass,
+            entry_data,
+            results,
+            type="genre",
+            genre=genre,
+            library=library_name,
+        )
+
+        _LOGGER.info("Genre browse completed: %d results found", len(results))
+
+    except PlexSearchAPIError as err:
+        _LOGGER.error("Get by genre failed: %s", err)
+        raise HomeAssistantError(f"Get by genre failed: {err}") from err
+
+
+async def _async_handle_get_collections(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Handle the get_collections service call."""
+    entry_data = _async_get_entry_data(hass, call)
+    api = entry_data["api"]
+    library_name = call.data["library_name"]
+
+    _LOGGER.info("Getting collections from: %s", library_name)
+
+    try:
+        results = await _async_cached_call(
+            entry_data,
+            api.async_get_collections,
+            library_name=library_name,
+        )
 
-            _LOGGER.info("Collections retrieved: %d found", len(results))
+        # Store results
+        entry_data["search_results"] = results
+
+        # Fire event
+        _async_fire_search_completed(
+            hass,
+            entry_data,
+            results,
+            type="collections",
+            library=library_name,
+        )
+
+        _LOGGER.info("Collections retrieved: %d found", len(results))
+
+    except PlexSearchAPIError as err:
+        _LOGGER.error("Get collections failed: %s", err)
+        raise HomeAssistantError(f"Get collections failed: {err}") from err
 
-        except PlexSearchAPIError as err:
-            _LOGGER.error("Get collections failed: %s", err)
-            raise HomeAssistantError(f"Get collections failed: {err}") from err
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Plex Search and Play services.
+
+    Services are registered once for the integration and routed to the right
+    config entry on each call, so they survive entries being added or removed.
+    """
     # Register services
     hass.services.async_register(
         DOMAIN,
         SERVICE_SEARCH,
-        handle_search,
+        partial(_async_handle_search, hass),
         schema=SERVICE_SEARCH_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         PLEX_SERVICE_PLAY_MEDIA,
-        handle_play_media,
+        partial(_async_handle_play_media, hass),
         schema=SERVICE_PLAY_MEDIA_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_CLEAR_RESULTS,
-        handle_clear_results,
+        partial(_async_handle_clear_results, hass),
+        schema=SERVICE_CLEAR_RESULTS_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_BROWSE_LIBRARY,
-        handle_browse_library,
+        partial(_async_handle_browse_library, hass),
         schema=SERVICE_BROWSE_LIBRARY_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_GET_ON_DECK,
-        handle_get_on_deck,
+        partial(_async_handle_get_on_deck, hass),
         schema=SERVICE_GET_ON_DECK_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_GET_RECENTLY_ADDED,
-        handle_get_recently_added,
+        partial(_async_handle_get_recently_added, hass),
         schema=SERVICE_GET_RECENTLY_ADDED_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_GET_BY_GENRE,
-        handle_get_by_genre,
+        partial(_async_handle_get_by_genre, hass),
         schema=SERVICE_GET_BY_GENRE_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_GET_COLLECTIONS,
-        handle_get_collections,
+        partial(_async_handle_get_collections, hass),
         schema=SERVICE_GET_COLLECTIONS_SCHEMA,
     )
 
+    @callback
+    def _async_shutdown_executor(event: Event) -> None:
+        """Stop the shared Plex worker threads."""
+        shutdown_executor()
+
+    hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_STOP, _async_shutdown_executor
+    )
+
+    return True
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up Plex Search and Play from a config entry."""
+    hass.data.setdefault(DOMAIN, {})
+
+    plex_url = entry.data[CONF_PLEX_URL]
+    plex_token = entry.data[CONF_PLEX_TOKEN]
+
+    # Create API instance
+    api = PlexSearchAPI(plex_url, plex_token)
+
+    try:
+        await api.async_connect()
+    except PlexSearchAPIError as err:
+        _LOGGER.error("Failed to connect to Plex server: %s", err)
+        await api.async_close()
+        return False
+
+    async def _async_current_results() -> dict[str, Any]:
+        """Return the last pushed results; they are never polled from Plex."""
+        return coordinator.data
+
+    # Sensors are updated by pushing each set of results to the coordinator
+    coordinator: DataUpdateCoordinator[dict[str, Any]] = DataUpdateCoordinator(
+        hass,
+        _LOGGER,
+        config_entry=entry,
+        name=f"{DOMAIN}_{entry.entry_id}",
+        update_method=_async_current_results,
+    )
+    coordinator.async_set_updated_data({"results": [], "query": ""})
+
+    # Store API instance and config
+    hass.data[DOMAIN][entry.entry_id] = {
+        "api": api,
+        "entry": entry,
+        **_async_resolve_config(entry),
+        "search_results": [],
+        "cache": {},
+        "inflight": {},
+        "plex_players": _async_get_plex_players(hass),
+        "coordinator": coordinator,
+    }
+
+    # Set up platforms
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    # Register update listener to update config when options change
+    entry.async_on_unload(entry.add_update_listener(update_listener))
+
+    @callback
+    def _async_entity_registry_updated(event: Event) -> None:
+        """Update the known Plex media players from a registry change.
+
+        Only the changed entity is looked at, so changes to other domains
+        cost a string check instead of a scan of the whole registry.
+        """
+        entity_id: str = event.data["entity_id"]
+        old_entity_id: str | None = event.data.get("old_entity_id")
+        if not entity_id.startswith(f"{MEDIA_PLAYER_DOMAIN}.") and not (
+            old_entity_id and old_entity_id.startswith(f"{MEDIA_PLAYER_DOMAIN}.")
+        ):
+            return
+
+        plex_players: set[str] = hass.data[DOMAIN][entry.entry_id]["plex_players"]
+        if old_entity_id:
+            plex_players.discard(old_entity_id)
+
+        registry_entry = er.async_get(hass).async_get(entity_id)
+        if (
+            event.data["action"] != "remove"
+            and registry_entry is not None
+            and registry_entry.platform == PLEX_PLATFORM
+            and registry_entry.domain == MEDIA_PLAYER_DOMAIN
+        ):
+            plex_players.add(entity_id)
+        else:
+            plex_players.discard(entity_id)
+
+    entry.async_on_unload(
+        hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, _async_entity_registry_updated
+        )
+    )
+
     _LOGGER.info("Plex Search and Play integration setup complete")
 
     return True
@@ -520,41 +828,29 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        # Remove services (only if this is the last entry)
-        entries = hass.config_entries.async_entries(DOMAIN)
-        if len(entries) == 1:  # This is the last entry
-            hass.services.async_remove(DOMAIN, SERVICE_SEARCH)
-            hass.services.async_remove(DOMAIN, PLEX_SERVICE_PLAY_MEDIA)
-            hass.services.async_remove(DOMAIN, SERVICE_CLEAR_RESULTS)
-            hass.services.async_remove(DOMAIN, SERVICE_BROWSE_LIBRARY)
-            hass.services.async_remove(DOMAIN, SERVICE_GET_ON_DECK)
-            hass.services.async_remove(DOMAIN, SERVICE_GET_RECENTLY_ADDED)
-            hass.services.async_remove(DOMAIN, SERVICE_GET_BY_GENRE)
-            hass.services.async_remove(DOMAIN, SERVICE_GET_COLLECTIONS)
-
         # Remove data
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        await entry_data["api"].async_close()
 
     return unload_ok
 
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
-    # Update stored config with new options
-    selected_players = entry.options.get(
-        CONF_SELECTED_PLAYERS,
-        entry.data.get(CONF_SELECTED_PLAYERS, [])
-    )
-    libraries = entry.options.get(
-        CONF_LIBRARIES,
-        entry.data.get(CONF_LIBRARIES, [])
-    )
+    entry_data = hass.data[DOMAIN][entry.entry_id]
 
-    # Update the stored data
-    hass.data[DOMAIN][entry.entry_id]["selected_players"] = selected_players
-    hass.data[DOMAIN][entry.entry_id]["libraries"] = libraries
+    # Update the stored data in place; handlers read it on every call
+    config = _async_resolve_config(entry)
+    entry_data.update(config)
 
-    _LOGGER.info("Updated configuration: players=%s, libraries=%s", selected_players, libraries)
+    # Cached responses may have been filtered by the old library selection
+    entry_data["cache"].clear()
+
+    _LOGGER.info(
+        "Updated configuration: players=%s, libraries=%s",
+        sorted(config["selected_players"]),
+        list(config["libraries"]),
+    )
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
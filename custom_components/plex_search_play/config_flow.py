@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import Any
 
 import voluptuous as vol
@@ -21,47 +23,103 @@ from .const import (
     CONF_PLEX_URL,
     CONF_SELECTED_PLAYERS,
     DEFAULT_PORT,
+    DEFAULT_TIMEOUT,
     DOMAIN,
     ERROR_CANNOT_CONNECT,
     ERROR_INVALID_AUTH,
     ERROR_UNKNOWN,
+    VALIDATE_CACHE_TTL_SECONDS,
 )
 from .plex_api import PlexSearchAPI, PlexSearchAPIError
 
 _LOGGER = logging.getLogger(__name__)
 
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_PLEX_URL, default=f"http://192.168.1.100:{DEFAULT_PORT}"): cv.string,
+        vol.Required(CONF_PLEX_TOKEN): cv.string,
+    }
+)
+
+# The player picker has no dynamic parameters, so build it once and share it
+# between the config and options flows
+_PLAYERS_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(
+        domain=MEDIA_PLAYER_DOMAIN,
+        multiple=True,
+    )
+)
+
+def _normalize_url(url: str) -> str:
+    """Strip trailing slashes from a server URL.
+
+    Most URLs have none, so check before scanning with rstrip.
+    """
+    return url.rstrip("/") if url.endswith("/") else url
+
 
-async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
+async def validate_input(
+    hass: HomeAssistant,
+    data: dict[str, Any],
+    cache: dict[tuple[str, str], tuple[float, dict[str, Any]]] | None = None,
+) -> dict[str, Any]:
     """Validate the user input allows us to connect.
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
+
+    A flow can pass its own cache so resubmitting the same credentials
+    within VALIDATE_CACHE_TTL_SECONDS doesn't reconnect to the server.
     """
-    plex_url = data[CONF_PLEX_URL].rstrip("/")
+    plex_url = _normalize_url(data[CONF_PLEX_URL])
     plex_token = data[CONF_PLEX_TOKEN]
 
+    cache_key = (plex_url, plex_token)
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < VALIDATE_CACHE_TTL_SECONDS:
+            return cached[1]
+
     # Create API instance and test connection
     api = PlexSearchAPI(plex_url, plex_token)
 
     try:
-        await api.async_connect()
+        # Bound the whole connect so an unreachable server fails fast
+        async with asyncio.timeout(DEFAULT_TIMEOUT):
+            await api.async_connect()
+    except TimeoutError as err:
+        await api.async_close()
+        raise CannotConnect from err
     except PlexSearchAPIError as err:
-        if err.args[0] == ERROR_INVALID_AUTH:
-            raise InvalidAuth from err
-        if err.args[0] == ERROR_CANNOT_CONNECT:
-            raise CannotConnect from err
+        await api.async_close()
+        flow_error = _FLOW_ERRORS.get(err.args[0] if err.args else None)
+        if flow_error is not None:
+            raise flow_error from err
         raise
 
-    # Get server name for unique ID
-    server_name = api.get_server_name()
+    try:
+        # Get server name for unique ID
+        server_name = api.get_server_name()
 
-    # Get available libraries
-    libraries = await api.async_get_libraries()
+        # Get available libraries
+        libraries = await api.async_get_libraries()
+    finally:
+        await api.async_close()
 
-    return {
-        "title": f"Plex: {server_name}",
+    info = {
+        "title": "Plex: " + server_name,
         "server_name": server_name,
         "libraries": libraries,
     }
+    if cache is not None:
+        # Drop expired entries so stale tokens aren't kept around
+        now = time.monotonic()
+        for stale_key in [
+            k for k, (ts, _) in cache.items() if now - ts >= VALIDATE_CACHE_TTL_SECONDS
+        ]:
+            del cache[stale_key]
+        cache[cache_key] = (now, info)
+
+    return info
 
 
 class PlexSearchPlayConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -73,6 +131,12 @@ class PlexSearchPlayConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self._data: dict[str, Any] = {}
         self._libraries: list[str] = []
+        self._validated_input: dict[str, Any] | None = None
+        self._server_unique_id: str | None = None
+        # Connection tests from this flow, dropped with the flow itself
+        self._validate_cache: dict[
+            tuple[str, str], tuple[float, dict[str, Any]]
+        ] = {}
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -82,14 +146,24 @@ class PlexSearchPlayConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                info = await validate_input(self.hass, user_input)
+                # Skip revalidation when the same input is submitted again
+                if user_input != self._validated_input:
+                    info = await validate_input(
+                        self.hass, user_input, self._validate_cache
+                    )
+                    self._validated_input = dict(user_input)
+                    self._libraries = info["libraries"]
+                    self._server_unique_id = info["server_name"].lower().replace(" ", "_")
 
-                # Store data for next step
-                self._data = user_input
-                self._libraries = info["libraries"]
+                # Store data for next step, with the URL normalized the same
+                # way validate_input does so media URLs don't get a double slash
+                self._data = {
+                    **user_input,
+                    CONF_PLEX_URL: _normalize_url(user_input[CONF_PLEX_URL]),
+                }
 
                 # Set unique ID based on server name
-                await self.async_set_unique_id(info["server_name"].lower().replace(" ", "_"))
+                await self.async_set_unique_id(self._server_unique_id)
                 self._abort_if_unique_id_configured()
 
                 # Move to media player selection step
@@ -104,16 +178,9 @@ class PlexSearchPlayConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = ERROR_UNKNOWN
 
         # Show form
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_PLEX_URL, default=f"http://192.168.1.100:{DEFAULT_PORT}"): cv.string,
-                vol.Required(CONF_PLEX_TOKEN): cv.string,
-            }
-        )
-
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
             description_placeholders={
                 "docs_url": "https://github.com/InfoSecured/plex-search-and-play#setup"
@@ -125,31 +192,23 @@ class PlexSearchPlayConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Handle media player selection step."""
         if user_input is not None:
-            # Combine all data
-            self._data[CONF_SELECTED_PLAYERS] = user_input.get(CONF_SELECTED_PLAYERS, [])
-            self._data[CONF_LIBRARIES] = user_input.get(CONF_LIBRARIES, [])
+            # Combine all data. Both fields have schema defaults, so they are
+            # always present and no fallback lists are needed
+            self._data.update(user_input)
 
             # Create entry
             return self.async_create_entry(
-                title=f"Plex Search and Play",
+                title="Plex Search and Play",
                 data=self._data,
             )
 
-        # Get all available media players
-        media_players = self.hass.states.async_entity_ids(MEDIA_PLAYER_DOMAIN)
-
         # Create schema with multi-select for players and libraries
         data_schema = vol.Schema(
             {
                 vol.Optional(
                     CONF_SELECTED_PLAYERS,
                     default=[],
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=MEDIA_PLAYER_DOMAIN,
-                        multiple=True,
-                    )
-                ),
+                ): _PLAYERS_SELECTOR,
                 vol.Optional(
                     CONF_LIBRARIES,
                     default=[],
@@ -184,6 +243,10 @@ class PlexSearchPlayConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 class PlexSearchPlayOptionsFlow(config_entries.OptionsFlow):
     """Handle options flow for Plex Search and Play."""
 
+    def __init__(self) -> None:
+        """Initialize the options flow."""
+        self._available_libraries: list[str] | None = None
+
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -201,19 +264,10 @@ class PlexSearchPlayOptionsFlow(config_entries.OptionsFlow):
             self.config_entry.data.get(CONF_LIBRARIES, [])
         )
 
-        # Get Plex API to fetch available libraries
-        plex_url = self.config_entry.data[CONF_PLEX_URL]
-        plex_token = self.config_entry.data[CONF_PLEX_TOKEN]
-        api = PlexSearchAPI(plex_url, plex_token)
-
-        try:
-            await api.async_connect()
-            available_libraries = await api.async_get_libraries()
-        except PlexSearchAPIError:
-            available_libraries = current_libraries
-
-        # Get all available media players
-        media_players = self.hass.states.async_entity_ids(MEDIA_PLAYER_DOMAIN)
+        # Libraries are fetched once per options flow and reused on re-render
+        if self._available_libraries is None:
+            self._available_libraries = await self._async_fetch_libraries(current_libraries)
+        available_libraries = self._available_libraries
 
         # Create options schema
         options_schema = vol.Schema(
@@ -221,12 +275,7 @@ class PlexSearchPlayOptionsFlow(config_entries.OptionsFlow):
                 vol.Optional(
                     CONF_SELECTED_PLAYERS,
                     default=current_players,
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=MEDIA_PLAYER_DOMAIN,
-                        multiple=True,
-                    )
-                ),
+                ): _PLAYERS_SELECTOR,
                 vol.Optional(
                     CONF_LIBRARIES,
                     default=current_libraries,
@@ -245,6 +294,38 @@ class PlexSearchPlayOptionsFlow(config_entries.OptionsFlow):
             data_schema=options_schema,
         )
 
+    async def _async_fetch_libraries(self, fallback: list[str]) -> list[str]:
+        """Fetch the library names available on the Plex server.
+
+        Returns the fallback list if the server can't be reached or reports no
+        libraries, so the current selection stays valid for the selector.
+        """
+        # Reuse the loaded entry's connection when there is one, reloading its
+        # cached list so libraries added on the server show up
+        entry_data = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+        if entry_data is not None:
+            try:
+                async with asyncio.timeout(DEFAULT_TIMEOUT):
+                    libraries = await entry_data["api"].async_get_libraries(refresh=True)
+            except TimeoutError:
+                return fallback
+            return libraries or fallback
+
+        plex_url = self.config_entry.data[CONF_PLEX_URL]
+        plex_token = self.config_entry.data[CONF_PLEX_TOKEN]
+        api = PlexSearchAPI(plex_url, plex_token)
+
+        try:
+            async with asyncio.timeout(DEFAULT_TIMEOUT):
+                await api.async_connect()
+                libraries = await api.async_get_libraries()
+        except (PlexSearchAPIError, TimeoutError):
+            return fallback
+        finally:
+            await api.async_close()
+
+        return libraries or fallback
+
 
 class CannotConnect(Exception):
     """Error to indicate we cannot connect."""
@@ -252,3 +333,10 @@ class CannotConnect(Exception):
 
 class InvalidAuth(Exception):
     """Error to indicate there is invalid auth."""
+
+
+# Map PlexSearchAPIError codes to the flow errors raised by validate_input
+_FLOW_ERRORS: dict[str | None, type[Exception]] = {
+    ERROR_INVALID_AUTH: InvalidAuth,
+    ERROR_CANNOT_CONNECT: CannotConnect,
+}
@@ -1,5 +1,6 @@
 """Constants for the Plex Search and Play integration."""
 
+import sys
 from typing import Final
 
 # Integration domain
@@ -16,6 +17,7 @@ DEFAULT_PORT: Final = 32400
 DEFAULT_SEARCH_LIMIT: Final = 6
 DEFAULT_BROWSE_LIMIT: Final = 50
 DEFAULT_BROWSE_PAGE_SIZE: Final = 50
+DEFAULT_BROWSE_SORT: Final = "titleSort"
 DEFAULT_TIMEOUT: Final = 10
 
 # Service names
@@ -28,6 +30,9 @@ SERVICE_GET_RECENTLY_ADDED: Final = "get_recently_added"
 SERVICE_GET_BY_GENRE: Final = "get_by_genre"
 SERVICE_GET_COLLECTIONS: Final = "get_collections"
 
+# Service attributes
+ATTR_CONFIG_ENTRY_ID: Final = "config_entry_id"
+
 # Sensor attributes
 ATTR_RATING_KEY: Final = "rating_key"
 ATTR_MEDIA_TYPE: Final = "media_type"
@@ -56,6 +61,12 @@ MEDIA_TYPE_EPISODE: Final = "episode"
 MEDIA_TYPE_ARTIST: Final = "artist"
 MEDIA_TYPE_ALBUM: Final = "album"
 MEDIA_TYPE_TRACK: Final = "track"
+MEDIA_TYPE_VIDEO: Final = "video"
+
+# Media type groups used for playback and icon selection
+VIDEO_MEDIA_TYPES: Final = frozenset({MEDIA_TYPE_MOVIE, MEDIA_TYPE_EPISODE, MEDIA_TYPE_VIDEO})
+TV_MEDIA_TYPES: Final = frozenset({MEDIA_TYPE_SHOW, MEDIA_TYPE_EPISODE})
+MUSIC_MEDIA_TYPES: Final = frozenset({MEDIA_TYPE_ARTIST, MEDIA_TYPE_ALBUM, MEDIA_TYPE_TRACK})
 
 # Event types
 EVENT_SEARCH_STARTED: Final = f"{DOMAIN}_search_started"
@@ -70,6 +81,10 @@ STORAGE_KEY: Final = f"{DOMAIN}_storage"
 
 # Update intervals
 SCAN_INTERVAL_SECONDS: Final = 300  # 5 minutes for library updates
+CACHE_TTL_SECONDS: Final = 30  # How long identical API responses are reused
+VALIDATE_CACHE_TTL_SECONDS: Final = 60  # How long a successful connection test is reused
+MEDIA_URL_CACHE_TTL_SECONDS: Final = 600  # How long a resolved playback URL is reused
+FORMAT_CACHE_SIZE: Final = 512  # Formatted media items kept for reuse across endpoints
 
 # Error messages
 ERROR_CANNOT_CONNECT: Final = "cannot_connect"
@@ -86,3 +101,19 @@ ICON_TV: Final = "mdi:television"
 ICON_MUSIC: Final = "mdi:music"
 ICON_PLAY: Final = "mdi:play"
 ICON_PLEX: Final = "mdi:plex"
+
+
+def _intern_constants() -> None:
+    """Intern the string constants defined in this module.
+
+    Literals made only of identifier characters are interned by the compiler
+    already; this also covers the f-string event names and values such as
+    "mdi:magnify", so dict lookups keyed by them can match on identity.
+    """
+    module_globals = globals()
+    for name, value in list(module_globals.items()):
+        if name.isupper() and isinstance(value, str):
+            module_globals[name] = sys.intern(value)
+
+
+_intern_constants()
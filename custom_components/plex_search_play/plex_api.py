@@ -3,13 +3,21 @@
 from __future__ import annotations
 
 import asyncio
-from functools import partial
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import logging
-from typing import Any
+import threading
+import time
+from typing import TYPE_CHECKING, Any, TypeVar
 
+from plexapi.base import PlexPartialObject
 from plexapi.exceptions import BadRequest, NotFound, Unauthorized
 from plexapi.server import PlexServer
-from plexapi.video import Episode, Movie, Show
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from homeassistant.exceptions import HomeAssistantError
 
@@ -32,19 +40,101 @@ from .const import (
     ATTR_THUMB,
     ATTR_WRITERS,
     ATTR_YEAR,
+    DEFAULT_BROWSE_SORT,
     DEFAULT_SEARCH_LIMIT,
     DEFAULT_TIMEOUT,
     ERROR_CANNOT_CONNECT,
     ERROR_INVALID_AUTH,
     ERROR_NO_RESULTS,
+    FORMAT_CACHE_SIZE,
     MEDIA_TYPE_EPISODE,
     MEDIA_TYPE_MOVIE,
     MEDIA_TYPE_SEASON,
     MEDIA_TYPE_SHOW,
+    MEDIA_URL_CACHE_TTL_SECONDS,
+    SCAN_INTERVAL_SECONDS,
 )
 
+if TYPE_CHECKING:
+    from plexapi.video import Episode, Movie, Show
+
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+class _PooledServer:
+    """A PlexServer shared by every wrapper using the same URL and token."""
+
+    __slots__ = ("server", "session", "users")
+
+    def __init__(self, server: PlexServer, session: requests.Session) -> None:
+        """Initialize the pool entry."""
+        self.server = server
+        self.session = session
+        self.users = 0
+
+
+# PlexServer instances keyed by (url, token), so config entries and flows
+# talking to the same server share one connection pool
+_SERVER_POOL: dict[tuple[str, str], _PooledServer] = {}
+# Guards the pool and wrappers' pool keys; never held across network I/O
+_SERVER_POOL_LOCK = threading.Lock()
+
+
+def _release_pooled_server(key: tuple[str, str]) -> None:
+    """Drop one reference to a pooled PlexServer.
+
+    The last user to release a server removes it from the pool and closes
+    its HTTP session.
+    """
+    with _SERVER_POOL_LOCK:
+        pooled = _SERVER_POOL.get(key)
+        if pooled is None:
+            return
+        pooled.users -= 1
+        if pooled.users > 0:
+            return
+        del _SERVER_POOL[key]
+
+    pooled.session.close()
+
+
+class _SharedExecutor:
+    """Worker threads shared by every wrapper, created on first use.
+
+    Only touched from the event loop, so no lock is needed.
+    """
+
+    __slots__ = ("executor",)
+
+    def __init__(self) -> None:
+        """Initialize without starting any threads."""
+        self.executor: ThreadPoolExecutor | None = None
+
+    def get(self) -> ThreadPoolExecutor:
+        """Return the executor, creating it if needed."""
+        if self.executor is None:
+            # Sized for per-section fan-out across every configured server,
+            # without competing with the rest of Home Assistant for threads
+            self.executor = ThreadPoolExecutor(
+                max_workers=32, thread_name_prefix="plex_search"
+            )
+        return self.executor
+
+    def shutdown(self) -> None:
+        """Stop the worker threads; a later call to get() starts new ones."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+
+_EXECUTOR = _SharedExecutor()
+
+
+def shutdown_executor() -> None:
+    """Shut down the shared executor when Home Assistant stops."""
+    _EXECUTOR.shutdown()
+
 
 class PlexSearchAPIError(HomeAssistantError):
     """Exception raised for Plex API errors."""
@@ -63,20 +153,136 @@ class PlexSearchAPI:
         """
         self._plex_url = plex_url
         self._plex_token = plex_token
+        self._token_query = f"?X-Plex-Token={plex_token}"
         self._timeout = timeout
+        self._pool_key: tuple[str, str] | None = None
+        self._closed = False
         self._server: PlexServer | None = None
+        self._server_name: str | None = None
         self._machine_identifier: str | None = None
+        self._sections: dict[str, Any] = {}
+        self._sections_updated: float = 0.0
+        self._warned_sync_libraries = False
+        # Formatting runs in worker threads, so the cache is guarded by a lock
+        # Values are (formatted item, whether it was built from full metadata)
+        self._format_cache: OrderedDict[
+            tuple[Any, int], tuple[dict[str, Any], bool]
+        ] = OrderedDict()
+        self._format_cache_lock = threading.Lock()
+        self._url_cache: dict[str, tuple[float, tuple[str, str]]] = {}
+        # Default browse sort per section key, or None if not offered
+        self._default_sorts: dict[str, Any] = {}
+
+    async def _async_add_executor_job(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a blocking call in the shared Plex executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_EXECUTOR.get(), func, *args)
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create the HTTP session used for every request to a server.
+
+        The connection pool is sized to match the executor so parallel
+        section fan-out doesn't queue on the adapter, and connections are
+        kept alive across calls. Only GET requests answered with a transient
+        gateway status are retried; connection and read errors fail at once
+        so the caller's timeout still applies.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=2,
+                connect=0,
+                read=0,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"GET"}),
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
-    def _connect_blocking(self) -> PlexServer:
+    def _connect_blocking(self) -> tuple[PlexServer, str, str]:
         """Blocking call to connect to Plex server.
 
-        This runs in an executor to avoid blocking the event loop.
+        This runs in an executor to avoid blocking the event loop. The server
+        name and machine identifier are read here too, so later lookups never
+        touch the PlexServer object from the event loop.
+
+        A PlexServer already pooled for the same URL and token is reused. The
+        section list is loaded here for both new and reused servers; listing
+        sections requires the token, so it also confirms a reused server still
+        accepts it.
+
+        Returns:
+            Tuple of (server, friendly name, machine identifier)
         """
-        return PlexServer(
-            self._plex_url,
-            self._plex_token,
-            timeout=self._timeout
-        )
+        # Drop any reference left from an earlier connect before taking a new one
+        self._release_server()
+
+        key = (self._plex_url, self._plex_token)
+        with _SERVER_POOL_LOCK:
+            pooled = _SERVER_POOL.get(key)
+            if pooled is not None:
+                pooled.users += 1
+
+        if pooled is None:
+            session = self._create_session()
+            try:
+                server = PlexServer(
+                    self._plex_url,
+                    self._plex_token,
+                    session=session,
+                    timeout=self._timeout
+                )
+            except Exception:
+                session.close()
+                raise
+
+            created = _PooledServer(server, session)
+            with _SERVER_POOL_LOCK:
+                pooled = _SERVER_POOL.setdefault(key, created)
+                pooled.users += 1
+            if pooled is not created:
+                # Another wrapper pooled a server for these credentials first
+                session.close()
+
+        try:
+            self._refresh_sections_blocking(pooled.server)
+        except Exception:
+            _release_pooled_server(key)
+            raise
+
+        # async_close may have run while this job was in flight; if so, give
+        # the reference back instead of keeping it on a closed wrapper
+        with _SERVER_POOL_LOCK:
+            closed = self._closed
+            if not closed:
+                self._pool_key = key
+        if closed:
+            _release_pooled_server(key)
+            raise PlexSearchAPIError(ERROR_CANNOT_CONNECT)
+
+        server = pooled.server
+        return server, server.friendlyName, server.machineIdentifier
+
+    def _release_server(self, close: bool = False) -> None:
+        """Drop this wrapper's reference to its pooled PlexServer.
+
+        Args:
+            close: Also mark the wrapper closed, so a connect still running in
+                the executor releases its reference when it finishes
+        """
+        with _SERVER_POOL_LOCK:
+            if close:
+                self._closed = True
+            key, self._pool_key = self._pool_key, None
+
+        if key is not None:
+            _release_pooled_server(key)
 
     async def async_connect(self) -> bool:
         """Test connection to Plex server.
@@ -88,15 +294,22 @@ class PlexSearchAPI:
             PlexSearchAPIError: If connection fails
         """
         try:
+            with self._format_cache_lock:
+                self._format_cache.clear()
+            self._url_cache.clear()
+            self._default_sorts.clear()
+
             # Run blocking PlexServer call in executor
-            loop = asyncio.get_event_loop()
-            self._server = await loop.run_in_executor(None, self._connect_blocking)
+            (
+                self._server,
+                self._server_name,
+                self._machine_identifier,
+            ) = await self._async_add_executor_job(self._connect_blocking)
 
-            # Test the connection and get machine identifier
-            _ = self._server.friendlyName
-            self._machine_identifier = self._server.machineIdentifier
-            _LOGGER.info("Successfully connected to Plex server: %s", self._server.friendlyName)
+            _LOGGER.info("Successfully connected to Plex server: %s", self._server_name)
             return True
+        except PlexSearchAPIError:
+            raise
         except Unauthorized as err:
             _LOGGER.error("Invalid Plex token")
             raise PlexSearchAPIError(ERROR_INVALID_AUTH) from err
@@ -109,40 +322,68 @@ class PlexSearchAPI:
 
     def get_server_name(self) -> str:
         """Get the friendly name of the Plex server."""
-        if self._server:
-            return self._server.friendlyName
-        return "Unknown"
+        return self._server_name or "Unknown"
 
     def get_machine_identifier(self) -> str | None:
         """Get the machine identifier of the Plex server."""
         return self._machine_identifier
 
-    def _search_blocking(
+    async def async_close(self) -> None:
+        """Release resources held by the wrapper."""
+        self._release_server(close=True)
+        self._server = None
+
+    def _search_section_blocking(
         self,
+        section_name: str,
         query: str,
-        library_sections: list[str] | None = None,
         limit: int = DEFAULT_SEARCH_LIMIT
     ) -> list[Any]:
-        """Blocking call to search Plex library.
+        """Blocking call to search a single library section.
 
         This runs in an executor to avoid blocking the event loop.
         """
-        results = []
-
-        if library_sections:
-            # Search specific library sections
-            for section_name in library_sections:
-                try:
-                    section = self._server.library.section(section_name)
-                    section_results = section.search(query, limit=limit)
-                    results.extend(section_results)
-                except NotFound:
-                    _LOGGER.warning("Library section '%s' not found", section_name)
-                    continue
-        else:
-            # Search all libraries
-            results = self._server.library.search(query, limit=limit)
+        return self._get_section(section_name).search(query, limit=limit)
+
+    def _search_all_blocking(
+        self,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT
+    ) -> list[Any]:
+        """Blocking call to search all Plex libraries.
 
+        This runs in an executor to avoid blocking the event loop.
+        """
+        return self._server.library.search(query, limit=limit)
+
+    async def _async_gather_sections(
+        self,
+        library_sections: list[str],
+        func: Callable[..., list[Any]],
+        *args: Any,
+    ) -> list[Any]:
+        """Run a blocking per-section call for every section in parallel.
+
+        Each section gets its own executor job so the round-trips overlap.
+        Results are merged in section order; missing sections are logged and
+        skipped.
+        """
+        section_results = await asyncio.gather(
+            *(
+                self._async_add_executor_job(func, section_name, *args)
+                for section_name in library_sections
+            ),
+            return_exceptions=True,
+        )
+
+        results: list[Any] = []
+        for section_name, section_result in zip(library_sections, section_results):
+            if isinstance(section_result, NotFound):
+                _LOGGER.warning("Library section '%s' not found", section_name)
+                continue
+            if isinstance(section_result, BaseException):
+                raise section_result
+            results.extend(section_result)
         return results
 
     async def async_search(
@@ -168,20 +409,24 @@ class PlexSearchAPI:
             await self.async_connect()
 
         try:
-            # Run blocking search in executor
-            loop = asyncio.get_event_loop()
-            results = await loop.run_in_executor(
-                None,
-                partial(self._search_blocking, query, library_sections, limit)
-            )
+            if library_sections:
+                # Search specific library sections in parallel
+                results = await self._async_gather_sections(
+                    library_sections, self._search_section_blocking, query, limit
+                )
+            else:
+                # Search all libraries
+                results = await self._async_add_executor_job(
+                    self._search_all_blocking, query, limit
+                )
 
             if not results:
                 _LOGGER.info("No results found for query: %s", query)
                 return []
 
-            # Parse and format results in executor to avoid blocking the event loop
-            formatted_results = await asyncio.to_thread(
-                self._format_results_blocking, results[:limit]
+            # Hydrate and format results in executor to avoid blocking the event loop
+            formatted_results = await self._async_add_executor_job(
+                self._format_search_results_blocking, results[:limit]
             )
 
             _LOGGER.info("Found %d results for query: %s", len(formatted_results), query)
@@ -191,9 +436,55 @@ class PlexSearchAPI:
             _LOGGER.exception("Error searching Plex: %s", err)
             raise PlexSearchAPIError(ERROR_NO_RESULTS) from err
 
+    def _hydrate_items_blocking(self, items: list[Any]) -> list[Any]:
+        """Replace partial items with full metadata fetched in one request.
+
+        Search results are partial objects, and plexapi reloads each one with
+        its own request the first time a missing attribute (roles, writers,
+        ...) is read. Fetching every partial item through a single
+        /library/metadata/<key>,<key> request avoids those per-item
+        round-trips. Items already formatted from full metadata are skipped,
+        and items that can't be batch-fetched are returned as-is.
+        """
+        with self._format_cache_lock:
+            rating_keys = [
+                str(item.ratingKey)
+                for item in items
+                if not _has_full_metadata(item)
+                and not self._format_cache.get(_format_cache_key(item), (None, False))[1]
+            ]
+        if not rating_keys:
+            return items
+
+        try:
+            full_items = self._server.fetchItems(
+                f"/library/metadata/{','.join(rating_keys)}"
+            )
+        except Exception as err:
+            _LOGGER.debug("Batch metadata fetch failed, loading items lazily: %s", err)
+            return items
+
+        hydrated: dict[Any, Any] = {}
+        for item in full_items:
+            # The batch response is complete; don't reload for empty attributes
+            item._autoReload = False
+            hydrated[item.ratingKey] = item
+        return [hydrated.get(item.ratingKey, item) for item in items]
+
+    def _format_search_results_blocking(self, items: list[Any]) -> list[dict[str, Any]]:
+        """Hydrate and format search results in a worker thread."""
+        return self._format_results_blocking(self._hydrate_items_blocking(items))
+
     def _format_media_item(self, item: Any, index: int) -> dict[str, Any]:
         """Format a Plex media item into a standardized dictionary.
 
+        Items that show up in several endpoints (e.g. both on deck and
+        recently added) are formatted once and reused until the item changes
+        on the server, as tracked by its ratingKey and updatedAt; items
+        without updatedAt are always formatted afresh. An entry
+        formatted from a partial object is not reused for an item that has
+        full metadata; it is reformatted and replaced instead.
+
         Args:
             item: Plex media item
             index: Index in the results list
@@ -201,43 +492,59 @@ class PlexSearchAPI:
         Returns:
             Formatted media item dictionary
         """
+        cache_key = _format_cache_key(item)
+        if cache_key is None:
+            return self._format_media_item_uncached(item, index)
+        full = _has_full_metadata(item)
+
+        with self._format_cache_lock:
+            cached = self._format_cache.get(cache_key)
+            if cached is not None and (cached[1] or not full):
+                self._format_cache.move_to_end(cache_key)
+            else:
+                cached = None
+        if cached is not None:
+            formatted = dict(cached[0])
+            formatted["index"] = index
+            return formatted
+
+        formatted = self._format_media_item_uncached(item, index)
+
+        with self._format_cache_lock:
+            self._format_cache[cache_key] = (dict(formatted), full)
+            self._format_cache.move_to_end(cache_key)
+            if len(self._format_cache) > FORMAT_CACHE_SIZE:
+                self._format_cache.popitem(last=False)
+
+        return formatted
+
+    def _format_media_item_uncached(self, item: Any, index: int) -> dict[str, Any]:
+        """Build the formatted dictionary for a Plex media item.
+
+        Optional scalar fields are read from a snapshot of the instance dict:
+        plexapi reloads a partial object when one of its attributes is read
+        while unset, and a missing summary or rating isn't worth a request.
+        """
+        attrs = vars(item)
+
         # Common attributes
         formatted = {
             "index": index,
             ATTR_RATING_KEY: str(item.ratingKey),
             "title": item.title,
-            ATTR_SUMMARY: getattr(item, "summary", ""),
+            ATTR_SUMMARY: attrs.get("summary", ""),
             ATTR_THUMB: self._get_thumb_url(item),
-            ATTR_YEAR: getattr(item, "year", None),
-            ATTR_RATING: getattr(item, "rating", None),
-            ATTR_DURATION: getattr(item, "duration", 0),
+            ATTR_YEAR: attrs.get("year"),
+            ATTR_RATING: attrs.get("rating"),
+            ATTR_DURATION: attrs.get("duration", 0),
             ATTR_LIBRARY_SECTION_ID: item.librarySectionID,
             ATTR_LIBRARY_SECTION_TITLE: item.librarySectionTitle,
         }
 
         # Media type specific attributes
-        if isinstance(item, Movie):
-            formatted[ATTR_MEDIA_TYPE] = MEDIA_TYPE_MOVIE
-            formatted[ATTR_STUDIO] = getattr(item, "studio", None)
-            formatted[ATTR_DIRECTOR] = self._get_directors(item)
-            formatted[ATTR_WRITERS] = self._get_writers(item)
-            formatted[ATTR_ACTORS] = self._get_actors(item)
-            formatted[ATTR_GENRES] = self._get_genres(item)
-
-        elif isinstance(item, Show):
-            formatted[ATTR_MEDIA_TYPE] = MEDIA_TYPE_SHOW
-            formatted[ATTR_STUDIO] = getattr(item, "studio", None)
-            formatted[ATTR_GENRES] = self._get_genres(item)
-
-        elif isinstance(item, Episode):
-            formatted[ATTR_MEDIA_TYPE] = MEDIA_TYPE_EPISODE
-            formatted[ATTR_PARENT_TITLE] = getattr(item, "seasonEpisode", "")  # e.g., "S01E05"
-            formatted[ATTR_GRANDPARENT_TITLE] = getattr(item, "grandparentTitle", "")  # Show name
-            formatted[ATTR_INDEX] = getattr(item, "index", None)  # Episode number
-            formatted[ATTR_PARENT_INDEX] = getattr(item, "parentIndex", None)  # Season number
-            formatted[ATTR_DIRECTOR] = self._get_directors(item)
-            formatted[ATTR_WRITERS] = self._get_writers(item)
-
+        formatter = _FORMATTERS.get(getattr(item, "TYPE", None))
+        if formatter is not None:
+            formatter(self, item, formatted)
         else:
             # Generic handling for other types
             formatted[ATTR_MEDIA_TYPE] = item.type
@@ -253,51 +560,51 @@ class PlexSearchAPI:
         Returns:
             Full thumbnail URL
         """
-        if not hasattr(item, "thumb") or not item.thumb:
+        # Read from the instance dict so an unset thumb doesn't trigger a reload
+        thumb = vars(item).get("thumb")
+        if not thumb:
             return ""
 
         # Return full URL including the server base URL
-        return f"{self._plex_url}{item.thumb}?X-Plex-Token={self._plex_token}"
+        return f"{self._plex_url}{thumb}{self._token_query}"
+
+    def _format_results_blocking(
+        self, items: list[Any], start: int = 0
+    ) -> list[dict[str, Any]]:
+        """Format a list of Plex media items in a worker thread.
 
-    def _format_results_blocking(self, items: list[Any]) -> list[dict[str, Any]]:
-        """Format a list of Plex media items in a worker thread."""
+        plexapi reloads partial objects when an unset attribute is read, so all
+        attribute access has to happen here rather than on the event loop.
+
+        Args:
+            items: Plex media items
+            start: Index of the first item, for paginated results
+        """
         formatted_results: list[dict[str, Any]] = []
-        for idx, item in enumerate(items):
+        # Bind the per-item calls once, this loop runs for every result
+        format_item = self._format_media_item
+        append = formatted_results.append
+        for idx, item in enumerate(items, start):
             try:
-                formatted_item = self._format_media_item(item, idx)
-                formatted_results.append(formatted_item)
+                append(format_item(item, idx))
             except Exception as err:
                 _LOGGER.warning("Error formatting media item: %s", err)
                 continue
         return formatted_results
 
-    def _get_genres(self, item: Any) -> list[str]:
-        """Extract genre names from a media item."""
-        try:
-            return [genre.tag for genre in item.genres] if hasattr(item, "genres") else []
-        except Exception:
-            return []
-
-    def _get_directors(self, item: Any) -> list[str]:
-        """Extract director names from a media item."""
-        try:
-            return [director.tag for director in item.directors] if hasattr(item, "directors") else []
-        except Exception:
-            return []
+    def _tags(self, item: Any, attr: str, limit: int | None = None) -> list[str]:
+        """Extract tag names (genres, directors, ...) from a media item.
 
-    def _get_writers(self, item: Any) -> list[str]:
-        """Extract writer names from a media item."""
-        try:
-            return [writer.tag for writer in item.writers] if hasattr(item, "writers") else []
-        except Exception:
-            return []
-
-    def _get_actors(self, item: Any) -> list[str]:
-        """Extract actor names from a media item (limited to first 5)."""
+        Args:
+            item: Plex media item
+            attr: Name of the tag list attribute, e.g. "genres" or "roles"
+            limit: Optional maximum number of tags to return
+        """
         try:
-            if hasattr(item, "roles"):
-                return [actor.tag for actor in item.roles[:5]]
-            return []
+            tags = getattr(item, attr, None)
+            if not tags:
+                return []
+            return [tag.tag for tag in islice(tags, limit)]
         except Exception:
             return []
 
@@ -307,17 +614,26 @@ class PlexSearchAPI:
         Args:
             rating_key: The Plex rating key for the media item
 
+        Resolved URLs are reused for MEDIA_URL_CACHE_TTL_SECONDS, so repeated
+        plays of the same item skip the metadata fetch.
+
         Returns:
             Tuple of (playback URL, media type string)
 
         Raises:
             PlexSearchAPIError: If media item not found
         """
+        cached = self._url_cache.get(rating_key)
+        if cached is not None and time.monotonic() - cached[0] < MEDIA_URL_CACHE_TTL_SECONDS:
+            return cached[1]
+
         if not self._server:
             await self.async_connect()
 
         try:
-            return await asyncio.to_thread(self._get_media_url_blocking, rating_key)
+            media_url = await self._async_add_executor_job(
+                self._get_media_url_blocking, rating_key
+            )
         except NotFound as err:
             _LOGGER.error("Media item with rating key %s not found", rating_key)
             raise PlexSearchAPIError(ERROR_NO_RESULTS) from err
@@ -325,6 +641,17 @@ class PlexSearchAPI:
             _LOGGER.exception("Error getting media URL: %s", err)
             raise PlexSearchAPIError(ERROR_NO_RESULTS) from err
 
+        # Drop expired entries so the cache doesn't grow with every item played
+        now = time.monotonic()
+        for stale_key in [
+            key
+            for key, (ts, _) in self._url_cache.items()
+            if now - ts >= MEDIA_URL_CACHE_TTL_SECONDS
+        ]:
+            del self._url_cache[stale_key]
+        self._url_cache[rating_key] = (now, media_url)
+        return media_url
+
     def _get_media_url_blocking(self, rating_key: str) -> tuple[str, str]:
         """Blocking helper to get media URL and type (runs in executor thread)."""
         item = self._server.fetchItem(int(rating_key))
@@ -337,7 +664,7 @@ class PlexSearchAPI:
             if hasattr(media, "parts") and media.parts:
                 part = media.parts[0]
                 key = part.key
-                return f"{self._plex_url}{key}?X-Plex-Token={self._plex_token}", media_type
+                return f"{self._plex_url}{key}{self._token_query}", media_type
 
         # Fallback to transcoded stream URL if direct path not available
         try:
@@ -353,48 +680,174 @@ class PlexSearchAPI:
 
         raise PlexSearchAPIError("No playable media found")
 
-    def _get_libraries_blocking(self) -> list[str]:
+    def _refresh_sections_blocking(self, server: PlexServer | None = None) -> None:
+        """Blocking call to reload the library section cache.
+
+        Sections are keyed by lowercased title, matching plexapi's own
+        case-insensitive section lookup.
+
+        Args:
+            server: Server to load from, while connecting; defaults to the
+                connected server
+        """
+        server = server or self._server
+        self._sections = {
+            section.title.lower().strip(): section
+            for section in server.library.sections()
+        }
+        self._sections_updated = time.monotonic()
+
+    def _sections_fresh(self) -> bool:
+        """Return whether the cached section list can be used as is."""
+        return bool(self._sections) and (
+            time.monotonic() - self._sections_updated <= SCAN_INTERVAL_SECONDS
+        )
+
+    def _get_section(self, name: str) -> Any:
+        """Blocking call to get a library section by title.
+
+        Uses the cached section list, reloading it when it is older than
+        SCAN_INTERVAL_SECONDS.
+
+        Raises:
+            NotFound: If no section has the given title
+        """
+        if not self._sections_fresh():
+            self._refresh_sections_blocking()
+
+        try:
+            return self._sections[name.lower().strip()]
+        except KeyError as err:
+            raise NotFound(f"Unknown library section: {name}") from err
+
+    def _get_libraries_blocking(self, refresh: bool = False) -> list[str]:
         """Blocking call to get library sections.
 
-        This runs in an executor to avoid blocking the event loop.
+        This runs in an executor to avoid blocking the event loop. The section
+        cache is reloaded when asked to or when it is stale.
         """
-        return [section.title for section in self._server.library.sections()]
+        if refresh or not self._sections_fresh():
+            self._refresh_sections_blocking()
+        return [section.title for section in self._sections.values()]
 
-    async def async_get_libraries(self) -> list[str]:
+    async def async_get_libraries(self, refresh: bool = False) -> list[str]:
         """Get list of available library section names (async version).
 
+        The list loaded by async_connect is reused until it is older than
+        SCAN_INTERVAL_SECONDS, without an executor round-trip.
+
+        Args:
+            refresh: Reload the list from the server even if it is fresh
+
         Returns:
             List of library section names
         """
         if not self._server:
             return []
 
+        if not refresh and self._sections_fresh():
+            return [section.title for section in self._sections.values()]
+
         try:
-            loop = asyncio.get_event_loop()
-            libraries = await loop.run_in_executor(None, self._get_libraries_blocking)
+            libraries = await self._async_add_executor_job(
+                self._get_libraries_blocking, refresh
+            )
             return libraries
         except Exception as err:
             _LOGGER.exception("Error getting libraries: %s", err)
             return []
 
-    def get_libraries(self) -> list[str]:
+    def get_libraries(self, refresh: bool = False) -> list[str]:
         """Get list of available library section names (sync version - deprecated).
 
         Note: This is kept for backward compatibility but should not be called
-        from async contexts. Use async_get_libraries() instead.
+        from async contexts. Use async_get_libraries() instead. Like the async
+        version, the section list is only reloaded when it is stale.
+
+        Args:
+            refresh: Reload the list from the server even if it is fresh
 
         Returns:
             List of library section names
         """
+        if not self._warned_sync_libraries:
+            self._warned_sync_libraries = True
+            _LOGGER.warning(
+                "get_libraries is deprecated and may block; use async_get_libraries"
+            )
+
         if not self._server:
             return []
 
         try:
-            return self._get_libraries_blocking()
+            return self._get_libraries_blocking(refresh)
         except Exception as err:
             _LOGGER.exception("Error getting libraries: %s", err)
             return []
 
+    def _default_sort_blocking(self, section: Any) -> Any:
+        """Blocking call to get the default browse sort for a section.
+
+        DEFAULT_BROWSE_SORT is only used when the section lists it as a sort
+        field. The lookup is cached per section, and the FilteringSort object
+        is returned so plexapi doesn't validate it again on every page.
+
+        Returns:
+            The FilteringSort to apply, or None to keep the server's order
+        """
+        try:
+            return self._default_sorts[section.key]
+        except KeyError:
+            pass
+
+        try:
+            default_sort = next(
+                (
+                    field
+                    for field in section.listSorts()
+                    if field.key == DEFAULT_BROWSE_SORT
+                ),
+                None,
+            )
+        except Exception as err:
+            _LOGGER.debug(
+                "Could not list sorts for section '%s': %s", section.title, err
+            )
+            default_sort = None
+
+        self._default_sorts[section.key] = default_sort
+        return default_sort
+
+    def _browse_section_blocking(
+        self,
+        library_name: str,
+        start: int,
+        limit: int,
+        sort: str | None
+    ) -> tuple[list[Any], int]:
+        """Blocking call to fetch one page of a library section.
+
+        The page window and the sort are applied by the server through the
+        container offset, so only the requested items are transferred. The
+        total is read from the same response, so no second request is made.
+
+        Returns:
+            Tuple of (items in the page, total number of items in the section)
+        """
+        section = self._get_section(library_name)
+        page_items = section.all(
+            sort=sort or self._default_sort_blocking(section),
+            container_start=start,
+            container_size=limit,
+            maxresults=limit,
+        )
+        # The container's totalSize comes from the same query as the page,
+        # so it counts exactly the items all() would return
+        total = getattr(page_items, "totalSize", None)
+        if total is None:
+            total = start + len(page_items)
+        return page_items, total
+
     async def async_browse_library(
         self,
         library_name: str,
@@ -408,7 +861,9 @@ class PlexSearchAPI:
             library_name: Name of the library section to browse
             start: Starting index for pagination
             limit: Number of items to return
-            sort: Sort order (e.g., "titleSort", "addedAt:desc", "year:desc")
+            sort: Sort order (e.g., "titleSort", "addedAt:desc", "year:desc").
+                Defaults to DEFAULT_BROWSE_SORT where the section offers it,
+                so pages are stable across requests.
 
         Returns:
             Dictionary with results and pagination info
@@ -420,28 +875,19 @@ class PlexSearchAPI:
             await self.async_connect()
 
         try:
-            section = self._server.library.section(library_name)
-
-            # Get all items with optional sorting
-            if sort:
-                all_items = section.all(sort=sort)
-            else:
-                all_items = section.all()
-
-            total_count = len(all_items)
-
-            # Paginate results
-            paginated_items = all_items[start:start + limit]
+            # Fetch only the requested page in executor
+            paginated_items, total_count = await self._async_add_executor_job(
+                self._browse_section_blocking,
+                library_name,
+                start,
+                limit,
+                sort,
+            )
 
-            # Format items
-            formatted_results = []
-            for idx, item in enumerate(paginated_items):
-                try:
-                    formatted_item = self._format_media_item(item, start + idx)
-                    formatted_results.append(formatted_item)
-                except Exception as err:
-                    _LOGGER.warning("Error formatting media item: %s", err)
-                    continue
+            # Format items in executor to avoid blocking the event loop
+            formatted_results = await self._async_add_executor_job(
+                self._format_results_blocking, paginated_items, start
+            )
 
             _LOGGER.info(
                 "Browsing library '%s': returned %d items (start=%d, total=%d)",
@@ -463,6 +909,27 @@ class PlexSearchAPI:
             _LOGGER.exception("Error browsing library: %s", err)
             raise PlexSearchAPIError(ERROR_NO_RESULTS) from err
 
+    def _on_deck_section_blocking(self, section_name: str) -> list[Any]:
+        """Blocking call to get on deck items for a single library section."""
+        return self._get_section(section_name).onDeck()
+
+    def _format_on_deck_blocking(self, items: list[Any]) -> list[dict[str, Any]]:
+        """Format on deck items in a worker thread, adding the view offset."""
+        formatted_results = []
+        format_item = self._format_media_item
+        append = formatted_results.append
+        for idx, item in enumerate(items):
+            try:
+                formatted_item = format_item(item, idx)
+                # Add view offset for continue watching
+                if hasattr(item, "viewOffset"):
+                    formatted_item["view_offset"] = item.viewOffset
+                append(formatted_item)
+            except Exception as err:
+                _LOGGER.warning("Error formatting on deck item: %s", err)
+                continue
+        return formatted_results
+
     async def async_get_on_deck(
         self,
         library_sections: list[str] | None = None,
@@ -484,34 +951,19 @@ class PlexSearchAPI:
             await self.async_connect()
 
         try:
-            results = []
-
             if library_sections:
-                # Get on deck from specific sections
-                for section_name in library_sections:
-                    try:
-                        section = self._server.library.section(section_name)
-                        on_deck_items = section.onDeck()
-                        results.extend(on_deck_items)
-                    except NotFound:
-                        _LOGGER.warning("Library section '%s' not found", section_name)
-                        continue
+                # Get on deck from specific sections in parallel
+                results = await self._async_gather_sections(
+                    library_sections, self._on_deck_section_blocking
+                )
             else:
                 # Get on deck from all libraries
-                results = self._server.library.onDeck()
+                results = await self._async_add_executor_job(self._server.library.onDeck)
 
             # Format and limit results
-            formatted_results = []
-            for idx, item in enumerate(results[:limit]):
-                try:
-                    formatted_item = self._format_media_item(item, idx)
-                    # Add view offset for continue watching
-                    if hasattr(item, "viewOffset"):
-                        formatted_item["view_offset"] = item.viewOffset
-                    formatted_results.append(formatted_item)
-                except Exception as err:
-                    _LOGGER.warning("Error formatting on deck item: %s", err)
-                    continue
+            formatted_results = await self._async_add_executor_job(
+                self._format_on_deck_blocking, results[:limit]
+            )
 
             _LOGGER.info("Found %d on deck items", len(formatted_results))
             return formatted_results
@@ -520,6 +972,33 @@ class PlexSearchAPI:
             _LOGGER.exception("Error getting on deck items: %s", err)
             raise PlexSearchAPIError(ERROR_NO_RESULTS) from err
 
+    def _recently_added_section_blocking(
+        self, section_name: str, limit: int
+    ) -> list[Any]:
+        """Blocking call to get recently added items for a single library section."""
+        return self._get_section(section_name).recentlyAdded(maxresults=limit)
+
+    def _recently_added_all_blocking(self, limit: int) -> list[Any]:
+        """Blocking call to get recently added items across all libraries."""
+        return self._server.library.recentlyAdded(maxresults=limit)
+
+    def _format_recently_added_blocking(self, items: list[Any]) -> list[dict[str, Any]]:
+        """Format recently added items in a worker thread, adding the added date."""
+        formatted_results = []
+        format_item = self._format_media_item
+        append = formatted_results.append
+        for idx, item in enumerate(items):
+            try:
+                formatted_item = format_item(item, idx)
+                # Add added date if available
+                if hasattr(item, "addedAt"):
+                    formatted_item["added_at"] = item.addedAt.isoformat()
+                append(formatted_item)
+            except Exception as err:
+                _LOGGER.warning("Error formatting recently added item: %s", err)
+                continue
+        return formatted_results
+
     async def async_get_recently_added(
         self,
         library_sections: list[str] | None = None,
@@ -541,34 +1020,21 @@ class PlexSearchAPI:
             await self.async_connect()
 
         try:
-            results = []
-
             if library_sections:
-                # Get recently added from specific sections
-                for section_name in library_sections:
-                    try:
-                        section = self._server.library.section(section_name)
-                        recent_items = section.recentlyAdded(maxresults=limit)
-                        results.extend(recent_items)
-                    except NotFound:
-                        _LOGGER.warning("Library section '%s' not found", section_name)
-                        continue
+                # Get recently added from specific sections in parallel
+                results = await self._async_gather_sections(
+                    library_sections, self._recently_added_section_blocking, limit
+                )
             else:
                 # Get recently added from all libraries
-                results = self._server.library.recentlyAdded(maxresults=limit)
+                results = await self._async_add_executor_job(
+                    self._recently_added_all_blocking, limit
+                )
 
             # Format results
-            formatted_results = []
-            for idx, item in enumerate(results[:limit]):
-                try:
-                    formatted_item = self._format_media_item(item, idx)
-                    # Add added date if available
-                    if hasattr(item, "addedAt"):
-                        formatted_item["added_at"] = item.addedAt.isoformat()
-                    formatted_results.append(formatted_item)
-                except Exception as err:
-                    _LOGGER.warning("Error formatting recently added item: %s", err)
-                    continue
+            formatted_results = await self._async_add_executor_job(
+                self._format_recently_added_blocking, results[:limit]
+            )
 
             _LOGGER.info("Found %d recently added items", len(formatted_results))
             return formatted_results
@@ -577,6 +1043,12 @@ class PlexSearchAPI:
             _LOGGER.exception("Error getting recently added items: %s", err)
             raise PlexSearchAPIError(ERROR_NO_RESULTS) from err
 
+    def _get_by_genre_blocking(
+        self, library_name: str, genre: str, limit: int
+    ) -> list[Any]:
+        """Blocking call to get items of a genre from a library section."""
+        return self._get_section(library_name).search(genre=genre, limit=limit)
+
     async def async_get_by_genre(
         self,
         library_name: str,
@@ -600,20 +1072,15 @@ class PlexSearchAPI:
             await self.async_connect()
 
         try:
-            section = self._server.library.section(library_name)
-
-            # Search by genre
-            results = section.search(genre=genre, limit=limit)
+            # Search by genre in executor
+            results = await self._async_add_executor_job(
+                self._get_by_genre_blocking, library_name, genre, limit
+            )
 
-            # Format results
-            formatted_results = []
-            for idx, item in enumerate(results):
-                try:
-                    formatted_item = self._format_media_item(item, idx)
-                    formatted_results.append(formatted_item)
-                except Exception as err:
-                    _LOGGER.warning("Error formatting genre item: %s", err)
-                    continue
+            # Format results in executor to avoid blocking the event loop
+            formatted_results = await self._async_add_executor_job(
+                self._format_results_blocking, results
+            )
 
             _LOGGER.info(
                 "Found %d items in genre '%s' from library '%s'",
@@ -628,6 +1095,32 @@ class PlexSearchAPI:
             _LOGGER.exception("Error getting items by genre: %s", err)
             raise PlexSearchAPIError(ERROR_NO_RESULTS) from err
 
+    def _get_collections_blocking(self, library_name: str) -> list[Any]:
+        """Blocking call to get the collections of a library section."""
+        return self._get_section(library_name).collections()
+
+    def _format_collections_blocking(
+        self, collections: list[Any]
+    ) -> list[dict[str, Any]]:
+        """Format collections in a worker thread."""
+        formatted_collections = []
+        for idx, collection in enumerate(collections):
+            try:
+                formatted_collection = {
+                    "index": idx,
+                    ATTR_RATING_KEY: str(collection.ratingKey),
+                    "title": collection.title,
+                    ATTR_SUMMARY: getattr(collection, "summary", ""),
+                    ATTR_THUMB: self._get_thumb_url(collection),
+                    "child_count": getattr(collection, "childCount", 0),
+                    ATTR_MEDIA_TYPE: "collection"
+                }
+                formatted_collections.append(formatted_collection)
+            except Exception as err:
+                _LOGGER.warning("Error formatting collection: %s", err)
+                continue
+        return formatted_collections
+
     async def async_get_collections(
         self,
         library_name: str
@@ -647,25 +1140,15 @@ class PlexSearchAPI:
             await self.async_connect()
 
         try:
-            section = self._server.library.section(library_name)
-            collections = section.collections()
-
-            formatted_collections = []
-            for idx, collection in enumerate(collections):
-                try:
-                    formatted_collection = {
-                        "index": idx,
-                        ATTR_RATING_KEY: str(collection.ratingKey),
-                        "title": collection.title,
-                        ATTR_SUMMARY: getattr(collection, "summary", ""),
-                        ATTR_THUMB: self._get_thumb_url(collection),
-                        "child_count": getattr(collection, "childCount", 0),
-                        ATTR_MEDIA_TYPE: "collection"
-                    }
-                    formatted_collections.append(formatted_collection)
-                except Exception as err:
-                    _LOGGER.warning("Error formatting collection: %s", err)
-                    continue
+            # Get collections in executor
+            collections = await self._async_add_executor_job(
+                self._get_collections_blocking, library_name
+            )
+
+            # Format collections in executor to avoid blocking the event loop
+            formatted_collections = await self._async_add_executor_job(
+                self._format_collections_blocking, collections
+            )
 
             _LOGGER.info("Found %d collections in library '%s'", len(formatted_collections), library_name)
             return formatted_collections
@@ -676,3 +1159,65 @@ class PlexSearchAPI:
         except Exception as err:
             _LOGGER.exception("Error getting collections: %s", err)
             raise PlexSearchAPIError(ERROR_NO_RESULTS) from err
+
+
+def _format_cache_key(item: Any) -> tuple[Any, int] | None:
+    """Return the format cache key of a media item.
+
+    updatedAt is read from the instance dict so an unset value doesn't make
+    plexapi reload the item. Without it a cached entry could never be
+    invalidated, so such items get no key and are not cached.
+    """
+    updated_at = vars(item).get("updatedAt")
+    if updated_at is None:
+        return None
+    return item.ratingKey, int(updated_at.timestamp())
+
+
+def _has_full_metadata(item: Any) -> bool:
+    """Return whether a media item carries its full metadata."""
+    return (
+        not isinstance(item, PlexPartialObject)
+        or item.isFullObject()
+        # Batch-hydrated items are complete but keep the batch request as
+        # their init path, so isFullObject() doesn't recognize them
+        or not item._autoReload
+    )
+
+
+def _format_movie(api: PlexSearchAPI, item: Movie, formatted: dict[str, Any]) -> None:
+    """Add movie specific attributes to a formatted media item."""
+    tags = api._tags
+    formatted[ATTR_MEDIA_TYPE] = MEDIA_TYPE_MOVIE
+    formatted[ATTR_STUDIO] = getattr(item, "studio", None)
+    formatted[ATTR_DIRECTOR] = tags(item, "directors")
+    formatted[ATTR_WRITERS] = tags(item, "writers")
+    formatted[ATTR_ACTORS] = tags(item, "roles", 5)
+    formatted[ATTR_GENRES] = tags(item, "genres")
+
+
+def _format_show(api: PlexSearchAPI, item: Show, formatted: dict[str, Any]) -> None:
+    """Add TV show specific attributes to a formatted media item."""
+    formatted[ATTR_MEDIA_TYPE] = MEDIA_TYPE_SHOW
+    formatted[ATTR_STUDIO] = getattr(item, "studio", None)
+    formatted[ATTR_GENRES] = api._tags(item, "genres")
+
+
+def _format_episode(api: PlexSearchAPI, item: Episode, formatted: dict[str, Any]) -> None:
+    """Add episode specific attributes to a formatted media item."""
+    formatted[ATTR_MEDIA_TYPE] = MEDIA_TYPE_EPISODE
+    formatted[ATTR_PARENT_TITLE] = getattr(item, "seasonEpisode", "")  # e.g., "S01E05"
+    formatted[ATTR_GRANDPARENT_TITLE] = getattr(item, "grandparentTitle", "")  # Show name
+    formatted[ATTR_INDEX] = getattr(item, "index", None)  # Episode number
+    formatted[ATTR_PARENT_INDEX] = getattr(item, "parentIndex", None)  # Season number
+    tags = api._tags
+    formatted[ATTR_DIRECTOR] = tags(item, "directors")
+    formatted[ATTR_WRITERS] = tags(item, "writers")
+
+
+# Type specific formatters, looked up by the item class's plexapi TYPE
+_FORMATTERS: dict[str, Callable[[PlexSearchAPI, Any, dict[str, Any]], None]] = {
+    MEDIA_TYPE_MOVIE: _format_movie,
+    MEDIA_TYPE_SHOW: _format_show,
+    MEDIA_TYPE_EPISODE: _format_episode,
+}
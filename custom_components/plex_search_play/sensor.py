@@ -9,7 +9,10 @@ from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
 
 from .const import (
     ATTR_ACTORS,
@@ -31,7 +34,6 @@ from .const import (
     ATTR_WRITERS,
     ATTR_YEAR,
     DOMAIN,
-    EVENT_SEARCH_COMPLETED,
     ICON_MOVIE,
     ICON_MUSIC,
     ICON_PLEX,
@@ -39,11 +41,42 @@ from .const import (
     ICON_TV,
     MEDIA_TYPE_EPISODE,
     MEDIA_TYPE_MOVIE,
-    MEDIA_TYPE_SHOW,
+    MUSIC_MEDIA_TYPES,
+    TV_MEDIA_TYPES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Attributes always exposed by a filled result sensor, with their defaults
+_RESULT_ATTRS: tuple[tuple[str, Any], ...] = (
+    (ATTR_RATING_KEY, None),
+    (ATTR_MEDIA_TYPE, None),
+    (ATTR_YEAR, None),
+    (ATTR_SUMMARY, ""),
+    (ATTR_THUMB, None),
+    (ATTR_DURATION, None),
+    (ATTR_RATING, None),
+    (ATTR_LIBRARY_SECTION_ID, None),
+    (ATTR_LIBRARY_SECTION_TITLE, None),
+)
+
+# Attributes exposed by a result sensor only when the result has them
+_OPTIONAL_ATTRS = frozenset(
+    (
+        ATTR_GENRES,
+        ATTR_STUDIO,
+        ATTR_DIRECTOR,
+        ATTR_WRITERS,
+        ATTR_ACTORS,
+        ATTR_PARENT_TITLE,
+        ATTR_GRANDPARENT_TITLE,
+        ATTR_INDEX,
+        ATTR_PARENT_INDEX,
+    )
+)
+
+_EMPTY_RESULT_ATTRS: dict[str, Any] = {"available": False}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -51,30 +84,37 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Plex Search and Play sensors."""
-    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
 
     # Create search status sensor
-    status_sensor = PlexSearchStatusSensor(config_entry)
+    status_sensor = PlexSearchStatusSensor(coordinator, config_entry)
 
     # Create result sensors (slots for up to 6 results)
     result_sensors = [
-        PlexSearchResultSensor(config_entry, index)
+        PlexSearchResultSensor(coordinator, config_entry, index)
         for index in range(6)
     ]
 
-    async_add_entities([status_sensor, *result_sensors], True)
+    async_add_entities([status_sensor, *result_sensors])
 
     _LOGGER.info("Plex Search and Play sensors created")
 
 
-class PlexSearchStatusSensor(SensorEntity):
+class PlexSearchStatusSensor(
+    CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], SensorEntity
+):
     """Sensor representing search status and result count."""
 
     _attr_has_entity_name = True
     _attr_icon = ICON_SEARCH
 
-    def __init__(self, config_entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator[dict[str, Any]],
+        config_entry: ConfigEntry,
+    ) -> None:
         """Initialize the search status sensor."""
+        super().__init__(coordinator)
         self._config_entry = config_entry
         self._attr_unique_id = f"{config_entry.entry_id}_search_status"
         self._attr_name = "Search Status"
@@ -87,8 +127,8 @@ class PlexSearchStatusSensor(SensorEntity):
         """Return additional state attributes."""
         # Get selected players and libraries from integration data
         entry_data = self.hass.data[DOMAIN].get(self._config_entry.entry_id, {})
-        selected_players = entry_data.get("selected_players", [])
-        libraries = entry_data.get("libraries", [])
+        selected_players = sorted(entry_data.get("selected_players", ()))
+        libraries = list(entry_data.get("libraries", ()))
 
         return {
             "result_count": self._result_count,
@@ -97,157 +137,92 @@ class PlexSearchStatusSensor(SensorEntity):
             "libraries": libraries,
         }
 
-    async def async_added_to_hass(self) -> None:
-        """Register callbacks when entity is added."""
-        # Listen for search events
-        self.async_on_remove(
-            self.hass.bus.async_listen(
-                EVENT_SEARCH_COMPLETED,
-                self._handle_search_completed
-            )
-        )
-
     @callback
-    def _handle_search_completed(self, event) -> None:
-        """Handle search completed event."""
-        self._result_count = event.data.get("result_count", 0)
-        self._last_query = event.data.get("query", "")
+    def _handle_coordinator_update(self) -> None:
+        """Handle new results pushed to the coordinator."""
+        self._result_count = len(self.coordinator.data["results"])
+        self._last_query = self.coordinator.data["query"]
         self._attr_native_value = f"Found {self._result_count} results"
-        self.async_write_ha_state()
+        super()._handle_coordinator_update()
 
 
-class PlexSearchResultSensor(SensorEntity):
+class PlexSearchResultSensor(
+    CoordinatorEntity[DataUpdateCoordinator[dict[str, Any]]], SensorEntity
+):
     """Sensor representing a single search result."""
 
     _attr_has_entity_name = True
 
-    def __init__(self, config_entry: ConfigEntry, index: int) -> None:
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator[dict[str, Any]],
+        config_entry: ConfigEntry,
+        index: int,
+    ) -> None:
         """Initialize the search result sensor."""
+        super().__init__(coordinator)
         self._config_entry = config_entry
         self._index = index
         self._attr_unique_id = f"{config_entry.entry_id}_result_{index}"
         self._attr_name = f"Result {index + 1}"
         self._attr_native_value = "Empty"
+        self._attr_icon = ICON_PLEX
+        self._attr_extra_state_attributes = _EMPTY_RESULT_ATTRS
         self._result_data: dict[str, Any] | None = None
 
-    @property
-    def icon(self) -> str:
-        """Return the icon based on media type."""
-        if not self._result_data:
-            return ICON_PLEX
+    def _set_result(self, result: dict[str, Any] | None) -> None:
+        """Store a search result and build the state exposed for it.
 
-        media_type = self._result_data.get(ATTR_MEDIA_TYPE)
-        if media_type == MEDIA_TYPE_MOVIE:
-            return ICON_MOVIE
-        if media_type in (MEDIA_TYPE_SHOW, MEDIA_TYPE_EPISODE):
-            return ICON_TV
-        if media_type in ("artist", "album", "track"):
-            return ICON_MUSIC
-        return ICON_PLEX
+        State, icon, picture and attributes are computed once here rather
+        than on every state read.
+        """
+        self._result_data = result
 
-    @property
-    def entity_picture(self) -> str | None:
-        """Return the entity picture (thumbnail)."""
-        if self._result_data:
-            return self._result_data.get(ATTR_THUMB)
-        return None
+        if result is None:
+            self._attr_native_value = "Empty"
+            self._attr_icon = ICON_PLEX
+            self._attr_entity_picture = None
+            self._attr_extra_state_attributes = _EMPTY_RESULT_ATTRS
+            return
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return detailed attributes for the search result."""
-        if not self._result_data:
-            return {"available": False}
-
-        attributes = {
-            "available": True,
-            ATTR_RATING_KEY: self._result_data.get(ATTR_RATING_KEY),
-            ATTR_MEDIA_TYPE: self._result_data.get(ATTR_MEDIA_TYPE),
-            ATTR_YEAR: self._result_data.get(ATTR_YEAR),
-            ATTR_SUMMARY: self._result_data.get(ATTR_SUMMARY, ""),
-            ATTR_THUMB: self._result_data.get(ATTR_THUMB),
-            ATTR_DURATION: self._result_data.get(ATTR_DURATION),
-            ATTR_RATING: self._result_data.get(ATTR_RATING),
-            ATTR_LIBRARY_SECTION_ID: self._result_data.get(ATTR_LIBRARY_SECTION_ID),
-            ATTR_LIBRARY_SECTION_TITLE: self._result_data.get(ATTR_LIBRARY_SECTION_TITLE),
-        }
+        title = result.get("title", "Unknown")
 
-        # Add optional attributes if present
-        optional_attrs = [
-            ATTR_GENRES,
-            ATTR_STUDIO,
-            ATTR_DIRECTOR,
-            ATTR_WRITERS,
-            ATTR_ACTORS,
-            ATTR_PARENT_TITLE,
-            ATTR_GRANDPARENT_TITLE,
-            ATTR_INDEX,
-            ATTR_PARENT_INDEX,
-        ]
-
-        for attr in optional_attrs:
-            if attr in self._result_data:
-                attributes[attr] = self._result_data[attr]
-
-        return attributes
-
-    async def async_added_to_hass(self) -> None:
-        """Register callbacks when entity is added."""
-        # Listen for search events
-        self.async_on_remove(
-            self.hass.bus.async_listen(
-                EVENT_SEARCH_COMPLETED,
-                self._handle_search_completed
-            )
-        )
+        # Format title based on media type
+        media_type = result.get(ATTR_MEDIA_TYPE)
+        if media_type == MEDIA_TYPE_EPISODE:
+            series = result.get(ATTR_GRANDPARENT_TITLE, "")
+            episode_info = result.get(ATTR_PARENT_TITLE, "")
+            self._attr_native_value = f"{series} - {episode_info} - {title}"
+        else:
+            year = result.get(ATTR_YEAR)
+            self._attr_native_value = f"{title} ({year})" if year else title
 
-    @callback
-    def _handle_search_completed(self, event) -> None:
-        """Handle search completed event."""
-        results = event.data.get("results", [])
-
-        if self._index < len(results):
-            # This slot has a result
-            self._result_data = results[self._index]
-            title = self._result_data.get("title", "Unknown")
-
-            # Format title based on media type
-            media_type = self._result_data.get(ATTR_MEDIA_TYPE)
-            if media_type == MEDIA_TYPE_EPISODE:
-                series = self._result_data.get(ATTR_GRANDPARENT_TITLE, "")
-                episode_info = self._result_data.get(ATTR_PARENT_TITLE, "")
-                self._attr_native_value = f"{series} - {episode_info} - {title}"
-            else:
-                year = self._result_data.get(ATTR_YEAR)
-                self._attr_native_value = f"{title} ({year})" if year else title
+        if media_type == MEDIA_TYPE_MOVIE:
+            self._attr_icon = ICON_MOVIE
+        elif media_type in TV_MEDIA_TYPES:
+            self._attr_icon = ICON_TV
+        elif media_type in MUSIC_MEDIA_TYPES:
+            self._attr_icon = ICON_MUSIC
         else:
-            # This slot is empty
-            self._result_data = None
-            self._attr_native_value = "Empty"
+            self._attr_icon = ICON_PLEX
 
-        self.async_write_ha_state()
+        self._attr_entity_picture = result.get(ATTR_THUMB)
 
-    async def async_update(self) -> None:
-        """Update the sensor state."""
-        # Get current search results from hass data
-        entry_data = self.hass.data[DOMAIN].get(self._config_entry.entry_id)
-        if not entry_data:
-            return
+        attributes = {"available": True}
+        attributes.update(
+            (attr, result.get(attr, default)) for attr, default in _RESULT_ATTRS
+        )
 
-        results = entry_data.get("search_results", [])
-
-        if self._index < len(results):
-            self._result_data = results[self._index]
-            title = self._result_data.get("title", "Unknown")
-
-            # Format title based on media type
-            media_type = self._result_data.get(ATTR_MEDIA_TYPE)
-            if media_type == MEDIA_TYPE_EPISODE:
-                series = self._result_data.get(ATTR_GRANDPARENT_TITLE, "")
-                episode_info = self._result_data.get(ATTR_PARENT_TITLE, "")
-                self._attr_native_value = f"{series} - {episode_info} - {title}"
-            else:
-                year = self._result_data.get(ATTR_YEAR)
-                self._attr_native_value = f"{title} ({year})" if year else title
-        else:
-            self._result_data = None
-            self._attr_native_value = "Empty"
+        # Add optional attributes if present
+        attributes.update(
+            (attr, value) for attr, value in result.items() if attr in _OPTIONAL_ATTRS
+        )
+
+        self._attr_extra_state_attributes = attributes
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle new results pushed to the coordinator."""
+        results = self.coordinator.data["results"]
+        self._set_result(results[self._index] if self._index < len(results) else None)
+        super()._handle_coordinator_update()